@@ -1,5 +1,22 @@
+import os
 import sys
+import math
+import time
+import sqlite3
+import json
+import csv
+import bisect
+import difflib
+import random
+import itertools
+import asyncio
+import functools
+import threading
+import multiprocessing
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
 import yfinance as yf
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from pytz import timezone
@@ -7,14 +24,81 @@ from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout,
     QLabel, QGridLayout, QHBoxLayout, QLineEdit, QPushButton,
     QRadioButton, QComboBox, QButtonGroup, QGroupBox, QMessageBox,
-    QFrame, QSizePolicy, QStyle
+    QFrame, QSizePolicy, QStyle, QCompleter, QTableWidget, QTableWidgetItem, QHeaderView,
+    QAbstractItemView, QShortcut
 )
 from PyQt5.QtChart import (
     QChart, QChartView, QCandlestickSeries, QCandlestickSet,
     QDateTimeAxis, QValueAxis, QLineSeries
 )
-from PyQt5.QtCore import Qt, QTimer, QDateTime, QPointF, QDate, QTime, QMargins
-from PyQt5.QtGui import QPainter, QColor, QPen, QFont, QLinearGradient, QBrush, QIcon
+from PyQt5.QtCore import (
+    Qt, QTimer, QDateTime, QPointF, QDate, QTime, QMargins,
+    QObject, QRunnable, QThreadPool, pyqtSignal, QStringListModel, QEvent
+)
+from PyQt5.QtGui import (
+    QPainter, QColor, QPen, QFont, QFontMetrics, QLinearGradient, QBrush, QIcon, QRegion, QKeySequence
+)
+
+# Yenileme zamanlayıcısı ayarları
+REFRESH_INTERVAL_MS = 60000
+MAX_REFRESH_INTERVAL_MS = 300000
+REFRESH_JITTER_MS = 3000
+SLOW_REFRESH_SECONDS = 20
+
+# Canlı akış: son mum birkaç saniyede bir güncellenir, tam yenileme seyrek yapılır
+STREAM_INTERVAL_MS = 5000
+STREAM_MIN_INTERVAL_MS = 50
+RECONCILE_INTERVAL_MS = 300000
+MARKET_OPEN = "09:55"
+MARKET_CLOSE = "18:05"
+
+# Uzaklaştırınca mumlar piksel genişliğine göre kovalara toplanır
+LOD_MIN_CANDLE_PX = 2
+LOD_MIN_BUCKETS = 50
+LOD_REFRESH_DELAY_MS = 50
+# Fare hareketindeki etiket yazıları en fazla kare başına bir kez güncellenir
+LABEL_FRAME_MS = 16
+
+# Yerel bar önbelleği
+DATA_DIR = os.path.join(os.path.expanduser("~"), ".bist_grafik")
+INTRADAY_RETENTION_DAYS = 8
+# Yahoo 1m veriyi ~7 gün geriye verir; daha eski son barı olan sembol için delta isteği yapılmaz,
+# yoksa toplu isteğin başlangıcı pencerenin dışına kayar ve gruptaki hiçbir sembole veri gelmez
+INTRADAY_DELTA_DAYS = 6
+# Düzeltilmiş fiyatlar: yeniden indirilen tamamlanmış günlük kapanış önbellektekinden bu oranda
+# farklıysa (bölünme, bedelsiz, temettü) sembolün günlük geçmişi baştan indirilir
+ADJUSTMENT_TOLERANCE = 0.001
+# Grafikte seçilebilen zaman dilimleri (dakika); dakikalık mumlardan yerelde üretilir
+TIMEFRAMES = {"1m": 1, "5m": 5, "15m": 15, "30m": 30, "1h": 60}
+
+# Geçmiş modu gün içi barları; Yahoo 1m veriyi yalnızca son ~7 gün, 5m veriyi 60 gün için verir
+HISTORY_DATE_COUNT = 30
+HISTORY_INTRADAY_PERIODS = (("5m", "60d"), ("1m", "7d"))
+
+# Veri istemcisi: eşzamanlı istek sınırı, istek başına zaman aşımı ve yeniden deneme
+CLIENT_MAX_CONCURRENCY = 4
+CLIENT_TIMEOUT_SECONDS = 30
+CLIENT_RETRIES = 3
+CLIENT_BACKOFF_SECONDS = 0.5
+
+# Bellek içi veri önbelleği (saniye)
+CACHE_MAX_ENTRIES = 256
+CACHE_TTLS = {"1m": 20, "5m": 60, "1d": 300, "info": 24 * 3600}
+
+# Yerel sembol listesi (programla birlikte gelir) ve arama önerisi sayısı
+SYMBOLS_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bist_symbols.csv")
+SEARCH_SUGGESTIONS = 10
+
+# Tarayıcı: sembol başına son kaç günlük bar, süreç havuzu boyutu ve iş başına en az sembol
+SCREENER_DEPTH = 260
+SCREENER_WORKERS = min(4, os.cpu_count() or 1)
+SCREENER_MIN_CHUNK = 50
+SCREENER_START_METHOD = "spawn"
+
+# İzleme: aşama başına tutulan son ölçüm sayısı, dışa aktarım için olay sınırı, HUD yenileme aralığı
+TRACE_WINDOW = 500
+TRACE_MAX_EVENTS = 200000
+HUD_REFRESH_MS = 500
 
 # Renk paleti
 DARK_BACKGROUND = "#121212"
@@ -25,6 +109,97 @@ RED_COLOR = "#F44336"
 TEXT_COLOR = "#E0E0E0"
 HIGHLIGHT_COLOR = "#2a2a2a"
 
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.name, self.start, time.perf_counter_ns(), **self.args)
+        return False
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NO_SPAN = _NoSpan()
+
+class Tracer:
+    # Aşama süreleri: Chrome izleme biçiminde olay listesi ve aşama başına kayan ölçüm penceresi.
+    # Kapalıyken span() paylaşılan boş bir bağlam döner; maliyet tek bir bayrak kontrolüdür.
+    def __init__(self, window=TRACE_WINDOW, max_events=TRACE_MAX_EVENTS):
+        self.enabled = False
+        self.window = window
+        self.events = deque(maxlen=max_events)
+        self.samples = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+
+    def span(self, name, **args):
+        if not self.enabled:
+            return _NO_SPAN
+        return _Span(self, name, args)
+
+    def record(self, name, start, end, **args):
+        if not self.enabled:
+            return
+        self.events.append((name, threading.get_ident(), start, end - start, args))
+        samples = self.samples.get(name)
+        if samples is None:
+            with self._lock:
+                samples = self.samples.setdefault(name, deque(maxlen=self.window))
+        samples.append(end - start)
+
+    def stats(self):
+        # {aşama: (ölçüm sayısı, p50 ms, p95 ms, en büyük ms)}
+        result = {}
+        for name, samples in list(self.samples.items()):
+            values = np.array(samples, dtype=float) / 1e6
+            if len(values):
+                p50, p95 = np.percentile(values, [50, 95])
+                result[name] = (len(values), p50, p95, values.max())
+        return result
+
+    def export(self, path):
+        # chrome://tracing ya da Perfetto ile açılabilen JSON
+        pid = os.getpid()
+        events = [
+            {"name": name, "ph": "X", "pid": pid, "tid": tid, "ts": (start - self._origin) / 1000,
+             "dur": duration / 1000, "args": {key: str(value) for key, value in args.items()}}
+            for name, tid, start, duration, args in list(self.events)
+        ]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def clear(self):
+        self.events.clear()
+        self.samples.clear()
+
+tracer = Tracer()
+
+def traced(name):
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
 def calculate_rsi(data, period=14):
     delta = data['Close'].diff()
     gain = delta.where(delta > 0, 0)
@@ -35,6 +210,1344 @@ def calculate_rsi(data, period=14):
     rsi = 100 - (100 / (1 + rs))
     return rsi
 
+@traced("filter_market_hours")
+def filter_market_hours(data):
+    if data.empty:
+        return data
+
+    try:
+        if len(data.index.normalize().unique()) < len(data.index):
+            if data.index.tz is None:
+                data.index = data.index.tz_localize('UTC')
+            data.index = data.index.tz_convert('Europe/Istanbul')
+            return data.between_time(MARKET_OPEN, MARKET_CLOSE)
+        return data
+    except Exception as e:
+        print(f"Zaman filtreleme hatası: {e}")
+        return data
+
+class RollingWindow:
+    # Sabit boyutlu halka tampon; toplam her adımda O(1) güncellenir
+    def __init__(self, size):
+        self.size = size
+        self.values = [0.0] * size
+        self.count = 0
+        self.total = 0.0
+        self.nonzero = 0
+        self._pos = 0
+        self._pushes = 0
+
+    def push(self, value):
+        if self.count == self.size:
+            old = self.values[self._pos]
+            self.total -= old
+            self.nonzero -= old != 0
+        else:
+            self.count += 1
+        self.values[self._pos] = value
+        self.total += value
+        self.nonzero += value != 0
+        self._pos = (self._pos + 1) % self.size
+        # Kayan nokta birikimini sınırlamak için ara sıra toplamı baştan al
+        self._pushes += 1
+        if self._pushes % self.size == 0:
+            self.total = math.fsum(self.values[:self.count])
+
+    def replace_last(self, value):
+        last = (self._pos - 1) % self.size
+        old = self.values[last]
+        self.total += value - old
+        self.nonzero += (value != 0) - (old != 0)
+        self.values[last] = value
+
+class StreamingIndicator:
+    def update(self, bar, revise=False):
+        raise NotImplementedError
+
+    @property
+    def value(self):
+        raise NotImplementedError
+
+class SMA(StreamingIndicator):
+    def __init__(self, period):
+        self.window = RollingWindow(period)
+
+    def update(self, bar, revise=False):
+        if revise:
+            self.window.replace_last(bar["Close"])
+        else:
+            self.window.push(bar["Close"])
+
+    @property
+    def value(self):
+        return self.window.total / self.window.count if self.window.count else float('nan')
+
+class RSI(StreamingIndicator):
+    # calculate_rsi ile aynı tanım: kazanç/kayıpların basit kayan ortalaması, ilk fark 0 sayılır
+    def __init__(self, period=14):
+        self.period = period
+        self.gains = RollingWindow(period)
+        self.losses = RollingWindow(period)
+        self._prev_close = None
+        self._last_close = None
+
+    def update(self, bar, revise=False):
+        close = bar["Close"]
+        if revise and self._last_close is not None:
+            delta = close - self._prev_close if self._prev_close is not None else 0.0
+            self.gains.replace_last(max(delta, 0.0))
+            self.losses.replace_last(max(-delta, 0.0))
+        else:
+            delta = close - self._last_close if self._last_close is not None else 0.0
+            self.gains.push(max(delta, 0.0))
+            self.losses.push(max(-delta, 0.0))
+            self._prev_close = self._last_close
+        self._last_close = close
+
+    @property
+    def value(self):
+        if self.gains.count < self.period:
+            return float('nan')
+        if self.losses.nonzero == 0:
+            return 100.0 if self.gains.nonzero else float('nan')
+        rs = (self.gains.total if self.gains.nonzero else 0.0) / self.losses.total
+        return 100 - (100 / (1 + rs))
+
+DEFAULT_INDICATORS = {
+    "MA20": lambda: SMA(20),
+    "MA50": lambda: SMA(50),
+    "MA200": lambda: SMA(200),
+    "RSI": lambda: RSI(14),
+}
+
+class IndicatorEngine:
+    # Yeni bar eklenince ya da son bar revize edilince göstergeleri O(1) günceller
+    def __init__(self, factories=None, warmup=200):
+        self.factories = dict(factories or DEFAULT_INDICATORS)
+        self.warmup = warmup
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.indicators = {name: factory() for name, factory in self.factories.items()}
+        self.last_index = None
+
+    def add(self, name, factory):
+        self.factories[name] = factory
+        self.indicators[name] = factory()
+
+    def update(self, index, bar):
+        revise = index == self.last_index
+        for indicator in self.indicators.values():
+            indicator.update(bar, revise)
+        self.last_index = index
+
+    def values(self):
+        return {name: indicator.value for name, indicator in self.indicators.items()}
+
+    def sync(self, frame):
+        # Son görülen bar hâlâ çerçevedeyse yalnızca o bar ve sonrası işlenir
+        if self.last_index is not None and self.last_index in frame.index:
+            new = frame.iloc[frame.index.get_loc(self.last_index):]
+        else:
+            self.reset()
+            new = frame.iloc[-self.warmup:]
+        for index, bar in zip(new.index, new.to_dict("records")):
+            self.update(index, bar)
+        return self.values()
+
+_indicator_engines = {}
+_indicator_engines_lock = threading.Lock()
+
+def indicator_engine(symbol):
+    with _indicator_engines_lock:
+        if symbol not in _indicator_engines:
+            _indicator_engines[symbol] = IndicatorEngine()
+        return _indicator_engines[symbol]
+
+def discard_indicator_engine(symbol):
+    with _indicator_engines_lock:
+        _indicator_engines.pop(symbol, None)
+
+@traced("indicators")
+def last_indicator_values(full_data, engine=None):
+    engine = engine or IndicatorEngine()
+    with engine.lock:
+        return engine.sync(full_data)
+
+def wall_clock_msecs(index):
+    # QDateTime(datetime) saat dilimini yok sayıp duvar saatini yerel saat kabul eder;
+    # aynı dönüşümü gün başına bir yerel saat farkı ile vektörel yapıyoruz
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    wall = index.values.astype("datetime64[ms]").astype("int64")
+    days, inverse = np.unique(index.normalize().values, return_inverse=True)
+    offsets = np.array([
+        QDateTime(pd.Timestamp(day).to_pydatetime() + timedelta(hours=12)).offsetFromUtc()
+        for day in days
+    ], dtype="int64") * 1000
+    return wall - offsets[inverse]
+
+def rsi_region(rsi):
+    return "Aşırı Alım" if rsi >= 70 else "Aşırı Satım" if rsi <= 30 else "Normal"
+
+class CandleStore:
+    # Bar başına ~80 bayt: zaman + OHLCV + kümülatifler float64, göstergeler float32
+    COLUMNS = {
+        "timestamp": np.int64,
+        "open": np.float64, "high": np.float64, "low": np.float64, "close": np.float64,
+        "volume": np.float64, "total_volume": np.float64, "money_flow": np.float64,
+        "rsi": np.float32, "ma20": np.float32, "ma50": np.float32, "ma200": np.float32,
+    }
+
+    def __init__(self, **columns):
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.ascontiguousarray(columns.get(name, ()), dtype=dtype))
+
+    def __len__(self):
+        return len(self.timestamp)
+
+    def clear(self):
+        self.__init__()
+
+    def slice(self, start, stop):
+        return CandleStore(**{name: getattr(self, name)[start:stop] for name in self.COLUMNS})
+
+    def with_bar(self, timestamp, open_, high, low, close, volume, **indicators):
+        # Aynı zaman damgalı son barı revize eden ya da sona yeni bar ekleyen bir kopya döner
+        replace = len(self) > 0 and timestamp == self.timestamp[-1]
+        base = len(self) - 1 if replace else len(self)
+        row = dict(indicators, timestamp=timestamp, open=open_, high=high, low=low, close=close, volume=volume,
+                   total_volume=(self.total_volume[base - 1] if base else 0.0) + volume,
+                   money_flow=(self.money_flow[base - 1] if base else 0.0) + close * volume)
+        columns = {}
+        for name in self.COLUMNS:
+            values = getattr(self, name)
+            value = row.get(name, values[-1] if len(values) else np.nan)
+            columns[name] = np.append(values[:base], value)
+        return CandleStore(**columns)
+
+    def concat(self, other):
+        return CandleStore(**{name: np.concatenate([getattr(self, name), getattr(other, name)])
+                              for name in self.COLUMNS})
+
+    def nearest(self, x):
+        # Zaman sütunu sıralı; en yakın bar ikili arama ile O(log n)
+        ts = self.timestamp
+        i = int(np.searchsorted(ts, x))
+        if i <= 0:
+            return 0
+        if i >= len(ts):
+            return len(ts) - 1
+        return i - 1 if x - ts[i - 1] <= ts[i] - x else i
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in self.COLUMNS)
+
+@traced("prepare_candles")
+def prepare_candles(data, live=True):
+    index = data.index if live else data.index.normalize()
+    close = data["Close"].to_numpy(dtype=float)
+    volume = data["Volume"].to_numpy(dtype=float)
+    missing = np.full(len(data), np.nan)
+    return CandleStore(
+        timestamp=wall_clock_msecs(index),
+        open=data["Open"].to_numpy(dtype=float),
+        high=data["High"].to_numpy(dtype=float),
+        low=data["Low"].to_numpy(dtype=float),
+        close=close,
+        volume=volume,
+        total_volume=np.nancumsum(volume),
+        money_flow=np.cumsum(close * volume),
+        rsi=data["RSI"].to_numpy(dtype=float) if "RSI" in data else missing,
+        ma20=data["MA20"].to_numpy(dtype=float) if "MA20" in data else missing,
+        ma50=data["MA50"].to_numpy(dtype=float) if "MA50" in data else missing,
+        ma200=data["MA200"].to_numpy(dtype=float) if "MA200" in data else missing,
+    )
+
+def aggregate_candles(candles, start, stop, size):
+    # Kova sınırları mutlak indekse hizalı; kaydırırken kovalar değişmez
+    first = np.arange(start, stop, size)
+    last = np.minimum(first + size, stop) - 1
+    return CandleStore(
+        timestamp=candles.timestamp[first],
+        open=candles.open[first],
+        high=np.fmax.reduceat(candles.high[start:stop], first - start),
+        low=np.fmin.reduceat(candles.low[start:stop], first - start),
+        close=candles.close[last],
+    )
+
+def resample_candles(candles, bucket_ms, offset_ms, start=0):
+    # Mumlar yerel saat sınırlarına hizalı kovalara toplanır; kümülatifler ve göstergeler kovanın son değeridir
+    ts = candles.timestamp[start:]
+    if not len(ts):
+        return CandleStore()
+    bucket = (ts + offset_ms) // bucket_ms
+    first = np.flatnonzero(np.concatenate([[True], bucket[1:] != bucket[:-1]]))
+    last = np.append(first[1:], len(ts)) - 1
+    columns = {name: getattr(candles, name)[start:] for name in CandleStore.COLUMNS}
+    result = {name: columns[name][last] for name in ("close", "total_volume", "money_flow",
+                                                     "rsi", "ma20", "ma50", "ma200")}
+    return CandleStore(
+        timestamp=bucket[first] * bucket_ms - offset_ms,
+        open=columns["open"][first],
+        high=np.fmax.reduceat(columns["high"], first),
+        low=np.fmin.reduceat(columns["low"], first),
+        volume=np.add.reduceat(np.nan_to_num(columns["volume"]), first),
+        **result,
+    )
+
+class CandleResampler:
+    # Dakikalık kaynaktan üst zaman dilimi; kaynak yalnızca sondan büyüdüyse son kova yeniden hesaplanır
+    def __init__(self, minutes):
+        self.bucket_ms = minutes * 60000
+        self.reset()
+
+    def reset(self):
+        self.source = CandleStore()
+        self.candles = CandleStore()
+        self._offset = None
+        self._tail = 0
+
+    def update(self, source):
+        if not len(source):
+            self.reset()
+            return self.candles
+        # Zaman damgaları yerel duvar saatini taşıdığından kova sınırı için yerel saat farkı eklenir
+        offset = QDateTime.fromMSecsSinceEpoch(int(source.timestamp[-1])).offsetFromUtc() * 1000
+        tail = self._tail
+        incremental = (
+            len(self.candles) and offset == self._offset and len(source) > tail
+            and all(np.array_equal(getattr(source, col)[:tail], getattr(self.source, col)[:tail])
+                    for col in ("timestamp", "open", "high", "low", "close", "volume"))
+        )
+        if incremental:
+            head = self.candles.slice(0, len(self.candles) - 1)
+            self.candles = head.concat(resample_candles(source, self.bucket_ms, offset, tail))
+        else:
+            self.candles = resample_candles(source, self.bucket_ms, offset)
+        self.source, self._offset = source, offset
+        self._tail = int(np.searchsorted(source.timestamp, self.candles.timestamp[-1]))
+        return self.candles
+
+def minmax_decimate(values, start, stop, size):
+    # Her kovadaki en küçük ve en büyük noktayı koruyan seyreltme
+    if size <= 1:
+        return np.arange(start, stop)
+    segment = np.asarray(values[start:stop], dtype=float)
+    n = len(segment)
+    buckets = np.concatenate([segment, np.full((-n) % size, np.nan)]).reshape(-1, size)
+    missing = np.isnan(buckets)
+    offsets = np.arange(len(buckets)) * size
+    lows = np.argmin(np.where(missing, np.inf, buckets), axis=1) + offsets
+    highs = np.argmax(np.where(missing, -np.inf, buckets), axis=1) + offsets
+    idx = np.unique(np.concatenate([lows, highs]))
+    return idx[idx < n] + start
+
+class NoDataError(Exception):
+    pass
+
+class TradingCalendar:
+    # Günlük barlardan çıkarılan işlem günleri; en yakın önceki işlem günü ikili aramayla bulunur
+    def __init__(self, index=None):
+        if index is None or len(index) == 0:
+            self.days = np.empty(0, dtype="datetime64[D]")
+        else:
+            if index.tz is not None:
+                index = index.tz_localize(None)
+            self.days = np.unique(index.values.astype("datetime64[D]"))
+
+    def __len__(self):
+        return len(self.days)
+
+    @property
+    def last_day(self):
+        return self.days[-1].astype(object)
+
+    def session_on_or_before(self, date):
+        day = np.datetime64(pd.Timestamp(date).date(), "D")
+        pos = int(np.searchsorted(self.days, day, side="right")) - 1
+        return self.days[pos].astype(object) if pos >= 0 else None
+
+    def labels(self, count):
+        return np.datetime_as_string(self.days[-count:], unit="D").tolist()
+
+def in_session(when):
+    # Hafta içi ve piyasa saatleri içinde mi (resmi tatiller bilinmiyor)
+    return when.weekday() < 5 and (
+        pd.Timestamp(MARKET_OPEN).time() <= when.time() <= pd.Timestamp(MARKET_CLOSE).time())
+
+def build_live_result(symbol, full_data, data, now):
+    if full_data.empty:
+        raise NoDataError("Günlük veri bulunamadı")
+    data = filter_market_hours(data)
+    data = data.assign(**last_indicator_values(full_data, indicator_engine(symbol)))
+    return {"live": True, "data": data, "candles": prepare_candles(data, True),
+            "pivot_date": now.date(), "notice": None}
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+class MarketDataClient:
+    # Ayrı bir iş parçacığındaki asyncio döngüsü; yfinance çağrıları sınırlı bir havuzda çalışır.
+    # yfinance süreç genelinde tek bir HTTP oturumu paylaştığından bağlantılar zaten yeniden kullanılır.
+    NON_RETRYABLE = (ValueError, KeyError, TypeError)
+
+    def __init__(self, max_concurrency=CLIENT_MAX_CONCURRENCY, timeout=CLIENT_TIMEOUT_SECONDS,
+                 retries=CLIENT_RETRIES, backoff=CLIENT_BACKOFF_SECONDS):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._loop = None
+        self._executor = None
+        self._semaphore = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_started(self):
+        with self._start_lock:
+            if self._loop is not None:
+                return
+            ready = threading.Event()
+            self._executor = ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="piyasa-verisi")
+            self._loop = asyncio.new_event_loop()
+
+            def run():
+                asyncio.set_event_loop(self._loop)
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                ready.set()
+                self._loop.run_forever()
+
+            threading.Thread(target=run, name="piyasa-verisi-dongu", daemon=True).start()
+            ready.wait()
+
+    def _release(self, future):
+        # Zaman aşımından sonra biten çağrının hatası sessizce tüketilir
+        if not future.cancelled():
+            future.exception()
+        self._semaphore.release()
+
+    async def _attempt(self, func, args, kwargs):
+        # Bekleme zaman aşımına uğrasa da engelleyen çağrı iş parçacığını tutmaya devam eder;
+        # yuva ancak çağrı gerçekten bittiğinde boşalır, böylece eşzamanlılık sınırı korunur ve
+        # yeniden deneme asılı çağrıların arkasında kuyrukta süre tüketmez
+        await self._semaphore.acquire()
+        future = asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs))
+        future.add_done_callback(self._release)
+        done, _ = await asyncio.wait({future}, timeout=self.timeout)
+        if not done:
+            raise asyncio.TimeoutError(f"{self.timeout} s içinde yanıt gelmedi")
+        return future.result()
+
+    async def fetch(self, func, *args, **kwargs):
+        for attempt in range(self.retries + 1):
+            try:
+                return await self._attempt(func, args, kwargs)
+            except self.NON_RETRYABLE:
+                raise
+            except Exception:
+                if attempt == self.retries:
+                    raise
+            # Üstel geri çekilme; eşzamanlı denemeler aynı anda yüklenmesin diye rastgele pay
+            await asyncio.sleep(self.backoff * 2 ** attempt * (0.5 + random.random()))
+
+    def submit(self, func, *args, **kwargs):
+        self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(self.fetch(func, *args, **kwargs), self._loop)
+
+    def call(self, func, *args, **kwargs):
+        return self.submit(func, *args, **kwargs).result()
+
+    def close(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._executor.shutdown(wait=False)
+            self._loop = None
+
+market_client = MarketDataClient()
+
+def resample_bars(frame, interval):
+    # Dakikalık barlardan daha büyük aralık; yerel saat sınırlarına hizalı
+    rule = {"1m": "1min", "5m": "5min", "15m": "15min", "30m": "30min", "1h": "1h", "1d": "1D"}[interval]
+    bars = frame.resample(rule).agg(
+        {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+    )
+    return bars[~pd.isna(bars["Close"])]
+
+class DataProvider:
+    # Tüm piyasa verisi bu arayüzden gelir; semboller ".IS" eki olmadan verilir.
+    # speed: sağlayıcının saatinin duvar saatine oranı (canlı veri için 1)
+    speed = 1.0
+
+    def now(self):
+        return datetime.now(timezone("Europe/Istanbul"))
+
+    def history(self, symbol, interval="1d", **kwargs):
+        raise NotImplementedError
+
+    def download(self, symbols, interval="1d", **kwargs):
+        # -> {sembol: OHLCV çerçevesi}
+        raise NotImplementedError
+
+    def info(self, symbol):
+        raise NotImplementedError
+
+    def quotes(self, symbols):
+        # -> {sembol: (dakika zaman damgası, son fiyat, o dakikadaki hacim)}
+        raise NotImplementedError
+
+class YahooProvider(DataProvider):
+    # Zaman aşımı HTTP isteğinin kendisine de verilir; istemcinin beklemesi yalnızca son güvencedir
+    def __init__(self, client=None):
+        self.client = client or market_client
+
+    def history(self, symbol, interval="1d", **kwargs):
+        return self.client.call(yf.Ticker(symbol + ".IS").history, interval=interval,
+                                timeout=self.client.timeout, **kwargs)
+
+    def download(self, symbols, interval="1d", **kwargs):
+        tickers = [symbol + ".IS" for symbol in symbols]
+        frame = self.client.call(yf.download, tickers=tickers, interval=interval, group_by="ticker",
+                                 auto_adjust=True, progress=False, threads=True,
+                                 timeout=self.client.timeout, **kwargs)
+        return {symbol: split_download(frame, symbol + ".IS") for symbol in symbols}
+
+    def info(self, symbol):
+        return self.client.call(lambda: yf.Ticker(symbol + ".IS").info)
+
+    def quotes(self, symbols):
+        # Tüm semboller için son birkaç dakikalık 1m barlar tek istekte; önbellek atlanır
+        frames = self.download(tuple(symbols), "1m", start=self.now() - timedelta(minutes=5))
+        quotes = {}
+        for symbol, frame in frames.items():
+            frame = frame[~pd.isna(frame["Close"])] if "Close" in frame else frame.iloc[0:0]
+            if not frame.empty:
+                quotes[symbol] = (frame.index[-1], float(frame["Close"].iloc[-1]), float(frame["Volume"].iloc[-1]))
+        return quotes
+
+class ReplayProvider(DataProvider):
+    # Kaydedilmiş barları hızlandırılmış bir saatle oynatır; ağa hiç çıkılmaz. Saatten sonraki barlar
+    # görünmez, eksik aralıklar saate kadar olan 1m barlardan türetilir.
+    def __init__(self, frames, speed=1.0, start=None):
+        self.frames = {
+            symbol: {interval: frame[~pd.isna(frame["Close"])] for interval, frame in intervals.items()}
+            for symbol, intervals in frames.items()
+        }
+        self.speed = float(speed)
+        self.start = pd.Timestamp(start) if start is not None else min(
+            intervals["1m"].index[0] for intervals in self.frames.values() if "1m" in intervals
+        )
+        self._started = time.monotonic()
+
+    @classmethod
+    def from_path(cls, path, speed=1.0, start=None):
+        # Dizin: <SEMBOL>_<aralık>.csv|.parquet (ör. THYAO_1m.csv, THYAO_1d.parquet)
+        # Tek dosya: "symbol" sütunlu dakikalık barlar
+        def read(file):
+            frame = pd.read_parquet(file) if file.endswith(".parquet") else pd.read_csv(file, index_col=0)
+            if not isinstance(frame.index, pd.DatetimeIndex):
+                # Ofsetsiz zamanlar İstanbul yerel saatidir; UTC'ye yalnızca karışık ofsetlerde çevrilir
+                try:
+                    frame.index = pd.to_datetime(frame.index)
+                except ValueError:
+                    frame.index = pd.to_datetime(frame.index, utc=True)
+            if not isinstance(frame.index, pd.DatetimeIndex):
+                frame.index = pd.to_datetime(frame.index, utc=True)
+            if frame.index.tz is None:
+                frame.index = frame.index.tz_localize("Europe/Istanbul")
+            return frame.tz_convert("Europe/Istanbul").sort_index()
+
+        frames = {}
+        if os.path.isdir(path):
+            for file in sorted(os.listdir(path)):
+                stem, ext = os.path.splitext(file)
+                if ext in (".csv", ".parquet") and "_" in stem:
+                    symbol, interval = stem.rsplit("_", 1)
+                    frames.setdefault(symbol.upper(), {})[interval] = read(os.path.join(path, file))
+        else:
+            data = read(path)
+            for symbol, frame in data.groupby("symbol"):
+                frames[str(symbol).upper()] = {"1m": frame.drop(columns="symbol")}
+        return cls(frames, speed, start)
+
+    def now(self):
+        clock = self.start + pd.Timedelta(seconds=int((time.monotonic() - self._started) * self.speed))
+        return clock.to_pydatetime()
+
+    @staticmethod
+    def _local(value):
+        value = pd.Timestamp(value)
+        return value.tz_localize("Europe/Istanbul") if value.tzinfo is None else value
+
+    def _bars(self, symbol, interval, clock):
+        intervals = self.frames.get(symbol, {})
+        if interval in intervals:
+            frame = intervals[interval]
+            return frame.iloc[:frame.index.searchsorted(clock, "right")]
+        if "1m" in intervals:
+            minutes = intervals["1m"]
+            return resample_bars(minutes.iloc[:minutes.index.searchsorted(clock, "right")], interval)
+        return pd.DataFrame(columns=OHLCV_COLUMNS, index=pd.DatetimeIndex([], tz="Europe/Istanbul"), dtype=float)
+
+    def history(self, symbol, interval="1d", period=None, start=None, end=None, **kwargs):
+        clock = pd.Timestamp(self.now())
+        frame = self._bars(symbol, interval, clock)
+        if start is not None:
+            frame = frame[frame.index >= self._local(start)]
+        if end is not None:
+            frame = frame[frame.index < self._local(end)]
+        if period is not None and start is None and not frame.empty:
+            # yfinance gibi: "1d" son işlem günü, diğerleri takvim günü
+            if period == "1d":
+                since = frame.index[-1].normalize()
+            else:
+                count, unit = int(period.rstrip("dmoy")), period.lstrip("0123456789")
+                since = clock - timedelta(days=count * {"d": 1, "mo": 30, "y": 365}[unit])
+            frame = frame[frame.index >= since]
+        return frame.copy()
+
+    def download(self, symbols, interval="1d", **kwargs):
+        return {symbol: self.history(symbol, interval, **kwargs) for symbol in symbols}
+
+    def info(self, symbol):
+        return {"shortName": symbol_index.name(symbol)}
+
+    def quotes(self, symbols):
+        # Oluşmakta olan dakika barı, açılıştan kapanışa doğrusal ilerletilerek fiyatlanır
+        clock = pd.Timestamp(self.now())
+        quotes = {}
+        for symbol in symbols:
+            frame = self.frames.get(symbol, {}).get("1m")
+            if frame is None:
+                continue
+            i = frame.index.searchsorted(clock, "right") - 1
+            if i < 0:
+                continue
+            bar = frame.iloc[i]
+            progress = min(1.0, (clock - frame.index[i]) / pd.Timedelta(minutes=1))
+            price = bar["Open"] + (bar["Close"] - bar["Open"]) * progress
+            quotes[symbol] = (frame.index[i], float(price), float(bar["Volume"]) * progress)
+        return quotes
+
+data_provider = YahooProvider()
+
+def set_data_provider(provider):
+    # Oynatılan veri gerçek önbelleğe karışmasın; oynatmada çubuklar bellekte tutulur
+    global data_provider, bar_store
+    data_provider = provider
+    market_cache.clear()
+    if not isinstance(provider, YahooProvider):
+        bar_store = BarStore(":memory:")
+
+class MarketDataCache:
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, ttl, loader):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                return entry[1]
+            # Aynı istek zaten yoldaysa onun sonucunu bekle
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            value = loader()
+        except Exception as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._inflight[key]
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        future.set_result(value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+market_cache = MarketDataCache()
+
+def _cache_key(kind, symbols, interval, kwargs):
+    return (kind, symbols, interval) + tuple(sorted((k, str(v)) for k, v in kwargs.items()))
+
+# Önbellekten dönen nesneler paylaşıldığı için çağırana kopya verilir
+def _traced_call(name, func, *args, **kwargs):
+    with tracer.span(name, args=args, kwargs=kwargs):
+        return func(*args, **kwargs)
+
+def _ttl(kind):
+    # Hızlandırılmış oynatmada önbellek süreleri sağlayıcının saatine göre kısalır
+    return CACHE_TTLS.get(kind, 60) / data_provider.speed
+
+def fetch_history(symbol, interval="1d", **kwargs):
+    frame = market_cache.get(
+        _cache_key("history", symbol, interval, kwargs), _ttl(interval),
+        lambda: _traced_call("history", data_provider.history, symbol, interval=interval, **kwargs)
+    )
+    return frame.copy()
+
+def fetch_info(symbol):
+    info = market_cache.get(
+        ("info", symbol), _ttl("info"),
+        lambda: data_provider.info(symbol)
+    )
+    return dict(info)
+
+class BarStore:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connection(self):
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS bars (
+                    symbol TEXT, interval TEXT, ts INTEGER,
+                    open REAL, high REAL, low REAL, close REAL, volume REAL,
+                    PRIMARY KEY (symbol, interval, ts)
+                )
+            """)
+        return self._conn
+
+    def load(self, symbol, interval, since=None):
+        query = "SELECT ts, open, high, low, close, volume FROM bars WHERE symbol = ? AND interval = ?"
+        params = [symbol, interval]
+        if since is not None:
+            query += " AND ts >= ?"
+            params.append(int(pd.Timestamp(since).timestamp()))
+        with self._lock:
+            rows = self._connection().execute(query + " ORDER BY ts", params).fetchall()
+        frame = pd.DataFrame(rows, columns=["ts"] + OHLCV_COLUMNS).astype({c: float for c in OHLCV_COLUMNS})
+        frame.index = pd.DatetimeIndex(pd.to_datetime(frame.pop("ts"), unit="s", utc=True)).tz_convert("Europe/Istanbul")
+        return frame
+
+    def load_wide(self, symbols, interval, depth):
+        # Her sembolün son `depth` barı sağa hizalı geniş çerçevelere (satır: bar sırası, sütun: sembol)
+        # dönüştürülür; son satır her sembolün en güncel barıdır. Son barı en son işlem gününden eski
+        # olan (işlem durdurulmuş ya da güncellenememiş) semboller dışarıda kalır; aylar önceki bar
+        # bugünün değeri gibi gösterilmez
+        symbols = list(symbols)
+        marks = ",".join("?" * len(symbols))
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT symbol, ts, high, low, close FROM bars WHERE interval = ? AND symbol IN ({marks}) "
+                "ORDER BY symbol, ts", [interval] + symbols
+            ).fetchall()
+        if not rows:
+            raise NoDataError("Taranacak günlük veri yok; bağlantıyı kontrol edip yeniden deneyin")
+        frame = pd.DataFrame(rows, columns=["symbol", "ts", "High", "Low", "Close"])
+        day = pd.to_datetime(frame["ts"], unit="s", utc=True).dt.tz_convert("Europe/Istanbul").dt.date
+        last_day = day.groupby(frame["symbol"]).transform("max")
+        frame = frame[last_day == day.max()]
+        frame["pos"] = frame.groupby("symbol").cumcount(ascending=False)
+        frame = frame[frame["pos"] < depth]
+        wide = frame.pivot(index="pos", columns="symbol").sort_index(ascending=False).reset_index(drop=True)
+        return {column: wide[column].astype(float) for column in ("High", "Low", "Close")}
+
+    def tail(self, symbol, interval, count):
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT ts, close FROM bars WHERE symbol = ? AND interval = ? ORDER BY ts DESC LIMIT ?",
+                (symbol, interval, count)
+            ).fetchall()
+        rows.reverse()
+        return pd.Series([close for _, close in rows], dtype=float, index=pd.DatetimeIndex(
+            pd.to_datetime([ts for ts, _ in rows], unit="s", utc=True)).tz_convert("Europe/Istanbul"))
+
+    def delete(self, symbol, interval):
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM bars WHERE symbol = ? AND interval = ?", (symbol, interval))
+            conn.commit()
+
+    def last_timestamp(self, symbol, interval):
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT MAX(ts) FROM bars WHERE symbol = ? AND interval = ?", (symbol, interval)
+            ).fetchone()
+        if row[0] is None:
+            return None
+        return pd.Timestamp(row[0], unit="s", tz="UTC").tz_convert("Europe/Istanbul")
+
+    def merge(self, symbol, interval, frame, keep_since=None):
+        frame = frame[~pd.isna(frame["Close"])] if "Close" in frame else frame.iloc[0:0]
+        index = frame.index if frame.index.tz is not None else frame.index.tz_localize("Europe/Istanbul")
+        ts = index.tz_convert("UTC").tz_localize(None).values.astype("datetime64[s]").astype("int64")
+        rows = zip(
+            [symbol] * len(frame), [interval] * len(frame), ts.tolist(),
+            frame["Open"].tolist(), frame["High"].tolist(), frame["Low"].tolist(),
+            frame["Close"].tolist(), frame["Volume"].fillna(0).tolist()
+        ) if len(frame) else []
+        with self._lock:
+            conn = self._connection()
+            conn.executemany("INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            if keep_since is not None:
+                conn.execute(
+                    "DELETE FROM bars WHERE symbol = ? AND interval = ? AND ts < ?",
+                    (symbol, interval, int(pd.Timestamp(keep_since).timestamp()))
+                )
+            conn.commit()
+
+bar_store = BarStore(os.path.join(DATA_DIR, "bars.sqlite3"))
+
+class SymbolInfoStore:
+    # Sembol adları diskte saklanır; aynı sembol tekrar arandığında ağa çıkılmaz
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._names = None
+
+    def _load(self):
+        if self._names is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._names = json.load(f)
+            except (OSError, ValueError):
+                self._names = {}
+        return self._names
+
+    def get(self, symbol):
+        with self._lock:
+            return self._load().get(symbol)
+
+    def all(self):
+        with self._lock:
+            return dict(self._load())
+
+    def set(self, symbol, name):
+        with self._lock:
+            names = self._load()
+            names[symbol] = name
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(names, f, ensure_ascii=False, indent=1)
+            os.replace(tmp, self.path)
+
+symbol_names = SymbolInfoStore(os.path.join(DATA_DIR, "symbols.json"))
+
+_TURKISH_ASCII = str.maketrans("çğıöşüÇĞİÖŞÜ", "cgiosuCGIOSU")
+
+def normalize_search(text):
+    return text.translate(_TURKISH_ASCII).lower().strip()
+
+class SymbolIndex:
+    # Sembol kodları ve şirket adı kelimeleri tek bir sıralı anahtar listesinde tutulur;
+    # önek araması bisect ile yapılır. Liste ilk aramada yüklenir, öğrenilen adlar eklenir.
+    def __init__(self, path, learned):
+        self.path = path
+        self.learned = learned
+        self._names = None
+        self._keys = []
+        self._symbols = []
+        self._unique_keys = []
+
+    def _ensure_loaded(self):
+        if self._names is not None:
+            return
+        names = {}
+        try:
+            with open(self.path, encoding="utf-8", newline="") as f:
+                for row in csv.DictReader(f):
+                    names[row["symbol"]] = row["name"]
+        except OSError as e:
+            print(f"Sembol listesi okunamadı: {e}")
+        names.update(self.learned.all())
+        self._names = names
+        self._rebuild()
+
+    def _rebuild(self):
+        entries = set()
+        for symbol, name in self._names.items():
+            entries.add((normalize_search(symbol), symbol))
+            entries.add((normalize_search(name), symbol))
+            for word in normalize_search(name).split():
+                entries.add((word, symbol))
+        entries = sorted(entries)
+        self._keys = [key for key, _ in entries]
+        self._symbols = [symbol for _, symbol in entries]
+        self._unique_keys = sorted(set(self._keys))
+
+    def __contains__(self, symbol):
+        self._ensure_loaded()
+        return symbol in self._names
+
+    def symbols(self):
+        self._ensure_loaded()
+        return sorted(self._names)
+
+    def name(self, symbol):
+        self._ensure_loaded()
+        return self._names.get(symbol, symbol)
+
+    def add(self, symbol, name):
+        self._ensure_loaded()
+        if self._names.get(symbol) != name:
+            self._names[symbol] = name
+            self._rebuild()
+
+    def search(self, text, limit=SEARCH_SUGGESTIONS):
+        self._ensure_loaded()
+        query = normalize_search(text)
+        if not query:
+            return []
+
+        found = set()
+        i = bisect.bisect_left(self._keys, query)
+        while i < len(self._keys) and self._keys[i].startswith(query):
+            found.add(self._symbols[i])
+            i += 1
+        # Kod öneki eşleşenler önce, ardından ad eşleşenleri
+        matches = sorted(found, key=lambda symbol: (not normalize_search(symbol).startswith(query), symbol))
+
+        if not matches:
+            # Yazım hatalarına karşı kodlar, tam adlar ve ad kelimeleri üzerinde yakın eşleşme;
+            # bulunan anahtarlar sıralı listeden sembollerine geri eşlenir
+            for key in difflib.get_close_matches(query, self._unique_keys, limit, 0.6):
+                i = bisect.bisect_left(self._keys, key)
+                while i < len(self._keys) and self._keys[i] == key:
+                    if self._symbols[i] not in matches:
+                        matches.append(self._symbols[i])
+                    i += 1
+        return matches[:limit]
+
+symbol_index = SymbolIndex(SYMBOLS_CSV, symbol_names)
+
+def split_download(frame, ticker):
+    if isinstance(frame.columns, pd.MultiIndex):
+        if ticker not in frame.columns.get_level_values(0):
+            return pd.DataFrame(columns=OHLCV_COLUMNS, dtype=float)
+        frame = frame[ticker]
+    return frame.dropna(how="all")
+
+def download_batch(symbols, interval="1d", **kwargs):
+    symbols = tuple(symbols)
+    frames = market_cache.get(
+        _cache_key("download", symbols, interval, kwargs), _ttl(interval),
+        lambda: _traced_call("download", data_provider.download, symbols, interval, **kwargs)
+    )
+    return {symbol: frame.copy() for symbol, frame in frames.items()}
+
+@traced("refresh_bars")
+def refresh_bars(symbols, interval, now):
+    # Önbellekte geçmişi olan semboller için yalnızca son bardan sonrası indirilir
+    if interval == "1d":
+        # Günlükte delta sondan bir önceki (tamamlanmış) bardan başlar; o barın kapanışı
+        # fiyat düzeltmesini yakalamak için önbellektekiyle karşılaştırılır
+        tails = {s: bar_store.tail(s, interval, 2) for s in symbols}
+        last = {s: tails[s].index[0] if len(tails[s]) else None for s in symbols}
+        keep_since = None
+        stale = [s for s in symbols if last[s] is not None]
+    else:
+        last = {s: bar_store.last_timestamp(s, interval) for s in symbols}
+        keep_since = now - timedelta(days=INTRADAY_RETENTION_DAYS)
+        delta_since = now - timedelta(days=INTRADAY_DELTA_DAYS)
+        stale = [s for s in symbols if last[s] is not None and last[s] >= delta_since]
+    missing = [s for s in symbols if s not in stale]
+
+    frames = {}
+    if stale:
+        start = min(last[s] for s in stale)
+        start = start.strftime('%Y-%m-%d') if interval == "1d" else start.to_pydatetime()
+        frames.update(download_batch(stale, start=start, interval=interval))
+    if interval == "1d":
+        for s in stale:
+            if len(tails[s]) < 2:
+                continue
+            frame = frames[s]
+            fresh = frame["Close"][frame.index.date == last[s].date()].dropna() if "Close" in frame else frame
+            cached = tails[s].iloc[0]
+            if len(fresh) and abs(fresh.iloc[-1] - cached) > ADJUSTMENT_TOLERANCE * abs(cached):
+                # Eski ve yeni barlar farklı düzeltme tabanında; geçmiş tümüyle yenilenir
+                bar_store.delete(s, "1d")
+                discard_indicator_engine(s)
+                del frames[s]
+                missing.append(s)
+    if missing and interval == "1d":
+        frames.update(download_batch(missing, period="1y", interval="1d"))
+        short = [s for s in missing if len(frames[s]) < 200]
+        if short:
+            frames.update(download_batch(short, period="2y", interval="1d"))
+    elif missing:
+        frames.update(download_batch(missing, period="1d", interval=interval))
+        empty = [s for s in missing if frames[s].empty]
+        if empty:
+            frames.update(download_batch(empty, start=(now - timedelta(days=1)).strftime('%Y-%m-%d'), interval=interval))
+
+    for symbol, frame in frames.items():
+        bar_store.merge(symbol, interval, frame, keep_since)
+
+def cached_live_result(symbol, now):
+    full_data = bar_store.load(symbol, "1d")
+    data = bar_store.load(symbol, "1m", since=now - timedelta(days=INTRADAY_RETENTION_DAYS))
+    if not data.empty:
+        # period="1d" davranışı: yalnızca son işlem günü
+        data = data[data.index.normalize() == data.index[-1].normalize()]
+    return build_live_result(symbol, full_data, data, now)
+
+# Aşağıdaki yükleyiciler arka plan iş parçacığında çalışır; Qt nesnelerine dokunmazlar
+def load_symbol_name(symbol):
+    name = symbol_names.get(symbol)
+    if name is None:
+        name = fetch_info(symbol).get('shortName')
+        if not name:
+            return symbol
+        symbol_names.set(symbol, name)
+    return name
+
+def load_trading_calendar(symbol):
+    # Canlı yükleme de aynı günlük delta isteğini yapar; önbellekten karşılanır
+    refresh_bars([symbol], "1d", data_provider.now())
+    data = bar_store.load(symbol, "1d")
+    return TradingCalendar(data.index[~pd.isna(data['Close'])])
+
+def load_live_batch(symbols):
+    now = data_provider.now()
+    refresh_bars(symbols, "1d", now)
+    refresh_bars(symbols, "1m", now)
+
+    # Sembol bazlı hatalar tüm turu düşürmesin; sekme kendi hatasını gösterir
+    results = {}
+    for symbol in symbols:
+        try:
+            results[symbol] = cached_live_result(symbol, now)
+        except Exception as e:
+            results[symbol] = e
+    return results
+
+def load_live_data(symbol):
+    result = load_live_batch([symbol])[symbol]
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+def load_cached_live_data(symbol):
+    # Ağa çıkmadan diskteki son durumu çizmek için; önbellek boşsa sessizce vazgeç
+    try:
+        result = cached_live_result(symbol, data_provider.now())
+    except Exception:
+        return None
+    return result if not result["data"].empty else None
+
+def daily_window(full_data, session, size=200):
+    # Seçilen işlem gününde biten gösterge penceresi
+    end = full_data.index.searchsorted(pd.Timestamp(session + timedelta(days=1), tz="Europe/Istanbul"))
+    return full_data.iloc[max(0, end - size):end]
+
+def load_historical_data(symbol, selected_date, calendar=None):
+    target_date = pd.to_datetime(selected_date).date()
+    notice = None
+
+    # Takvim seçilen günü kapsamıyorsa tek bir delta isteğiyle güncellenir; aksi halde ağa çıkılmaz
+    if calendar is None or not len(calendar) or target_date > calendar.last_day:
+        refresh_bars([symbol], "1d", data_provider.now())
+        calendar = None
+
+    full_data = bar_store.load(symbol, "1d", since=pd.Timestamp(target_date) - timedelta(days=300))
+    full_data = full_data[~pd.isna(full_data['Close'])]
+    if calendar is None:
+        calendar = TradingCalendar(full_data.index)
+
+    session = calendar.session_on_or_before(target_date)
+    if session is None:
+        raise NoDataError(f"{selected_date} tarihi için veri bulunamadı")
+    if session != target_date:
+        notice = f"{selected_date} tarihinde işlem yok. En yakın işlem günü ({session}) gösteriliyor."
+
+    full_data = daily_window(full_data, session)
+    if full_data.empty or full_data.index[-1].date() != session:
+        raise NoDataError(f"{selected_date} tarihi için veri bulunamadı")
+
+    data = full_data.iloc[-1:]
+    data = data.assign(**last_indicator_values(full_data))
+    return {"live": False, "data": data, "candles": prepare_candles(data, False),
+            "pivot_date": pd.to_datetime(selected_date).date(), "notice": notice}
+
+def load_intraday_history(symbol, dates):
+    # Tarih listesindeki günlerin gün içi barları aralık başına tek istekle alınır ve güne göre
+    # hazır sonuçlara bölünür; 1m verisi olan günlerde 5m verinin yerini alır
+    full_data = bar_store.load(symbol, "1d")
+    full_data = full_data[~pd.isna(full_data['Close'])]
+
+    days = {}
+    for interval, period in HISTORY_INTRADAY_PERIODS:
+        frame = filter_market_hours(fetch_history(symbol, period=period, interval=interval))
+        for day, bars in frame.groupby(frame.index.date):
+            days[day] = bars
+
+    results = {}
+    for date in dates:
+        session = pd.to_datetime(date).date()
+        data = days.get(session)
+        if data is None:
+            continue
+        data = data.assign(**last_indicator_values(daily_window(full_data, session)))
+        results[date] = {"live": False, "data": data, "candles": prepare_candles(data, True),
+                         "pivot_date": session, "notice": None}
+    return results
+
+def screen_chunk(high, low, close):
+    # Sembollerin tamamı tek seferde, sütun bazında vektörel hesaplanır; sekmedeki formüllerle aynı.
+    # SMA gibi ortalamalar eldeki bar sayısıyla başlar (kısa geçmişli semboller için de MA200 olur)
+    rsi = calculate_rsi({'Close': close})
+    ma20, ma50, ma200 = (close.rolling(window, min_periods=1).mean() for window in (20, 50, 200))
+    h, l, c = high.iloc[-1], low.iloc[-1], close.iloc[-1]
+    pivot = (h + l + c) / 3
+    above = close.iloc[-1] >= ma200.iloc[-1]
+    was_above = close.iloc[-2] >= ma200.iloc[-2]
+    crossed = ma200.iloc[-2:].notna().all()
+    return pd.DataFrame({
+        "close": c,
+        "change": (c / close.iloc[-2] - 1) * 100,
+        "rsi": rsi.iloc[-1],
+        "ma20": ma20.iloc[-1],
+        "ma50": ma50.iloc[-1],
+        "ma200": ma200.iloc[-1],
+        "pivot": pivot,
+        "s1": 2 * pivot - h,
+        "s2": pivot - (h - l),
+        "r1": 2 * pivot - l,
+        "r2": pivot + (h - l),
+        "cross": np.where(crossed & above & ~was_above, 1, np.where(crossed & ~above & was_above, -1, 0)),
+    }, index=close.columns)
+
+class Screener:
+    # Günlük barlar önbellekten (eksikse tek toplu indirmeyle) alınır; hesap sütun gruplarına
+    # bölünüp süreç havuzunda çalışır. Havuz ilk büyük taramada kurulur ve yeniden kullanılır.
+    def __init__(self, workers=SCREENER_WORKERS, min_chunk=SCREENER_MIN_CHUNK):
+        self.workers = workers
+        self.min_chunk = min_chunk
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _executor(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    self.workers, mp_context=multiprocessing.get_context(SCREENER_START_METHOD)
+                )
+            return self._pool
+
+    def compute(self, wide):
+        columns = wide["Close"].columns
+        size = max(self.min_chunk, -(-len(columns) // self.workers))
+        chunks = [columns[i:i + size] for i in range(0, len(columns), size)]
+        args = [[wide[name][chunk] for name in ("High", "Low", "Close")] for chunk in chunks]
+        if len(chunks) <= 1:
+            return screen_chunk(*args[0]) if args else pd.DataFrame()
+        return pd.concat(self._executor().map(screen_chunk, *zip(*args)))
+
+    def run(self, symbols):
+        refresh_bars(symbols, "1d", data_provider.now())
+        result = self.compute(bar_store.load_wide(symbols, "1d", SCREENER_DEPTH))
+        result.insert(0, "name", [symbol_index.name(symbol) for symbol in result.index])
+        return result
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+screener = Screener()
+
+_request_ids = itertools.count(1)
+
+class FetchSignals(QObject):
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, object)
+
+class FetchTask(QRunnable):
+    def __init__(self, request_id, func, *args):
+        super().__init__()
+        # Görev havuza aittir ve run() bitince havuz tarafından silinir; iptal edilip sözlükten
+        # çıkarılan ama kuyrukta bekleyen görevler böylece geçersiz bir işaretçi bırakmaz.
+        # Sahipler yalnızca Python özniteliklerine (signals, cancel) dokunur.
+        self.setAutoDelete(True)
+        self.request_id = request_id
+        self.func = func
+        self.args = args
+        self.signals = FetchSignals()
+        self.created_ns = time.perf_counter_ns()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def is_cancelled(self):
+        return self._cancelled.is_set()
+
+    def run(self):
+        if self.is_cancelled():
+            return
+        try:
+            with tracer.span(f"task:{self.func.__name__}"):
+                result = self.func(*self.args)
+        except Exception as e:
+            if not self.is_cancelled():
+                self.signals.failed.emit(self.request_id, e)
+        else:
+            if not self.is_cancelled():
+                self.signals.finished.emit(self.request_id, result)
+
+class RefreshScheduler(QObject):
+    def __init__(self, tabs, parent=None):
+        super().__init__(parent)
+        self._tabs = tabs
+        self.quote_source = data_provider
+        self.interval = self.base_interval
+        self._task = None
+        self._quote_task = None
+        self._started_at = 0.0
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.refresh)
+        self.stream_timer = QTimer(self)
+        self.stream_timer.setInterval(max(STREAM_MIN_INTERVAL_MS, int(STREAM_INTERVAL_MS / data_provider.speed)))
+        self.stream_timer.timeout.connect(self.stream)
+
+    @property
+    def base_interval(self):
+        # Akış açıkken tam yenileme yalnızca mutabakat içindir; hızlandırılmış oynatmada aralıklar kısalır
+        interval = RECONCILE_INTERVAL_MS if self.quote_source is not None else REFRESH_INTERVAL_MS
+        return max(1000, int(interval / data_provider.speed))
+
+    def start(self):
+        self._schedule_next()
+        self.stream_timer.start()
+
+    def _schedule_next(self):
+        jitter = random.randint(-REFRESH_JITTER_MS, REFRESH_JITTER_MS)
+        self.timer.start(max(1000, self.interval + jitter))
+
+    def _live_tabs(self):
+        # Arka plandaki ya da pencere simge durumundayken sekmeler atlanır; görünür olunca yetişirler
+        tabs = [tab for tab in self._tabs() if tab.wants_live_refresh()]
+        for tab in tabs:
+            if not tab.is_on_screen():
+                tab.mark_stale()
+        return [tab for tab in tabs if tab.is_on_screen()]
+
+    def refresh(self):
+        symbols = sorted({tab.symbol for tab in self._live_tabs()})
+        if not symbols:
+            self._schedule_next()
+            return
+        self._task = FetchTask(next(_request_ids), load_live_batch, symbols)
+        self._task.signals.finished.connect(self._on_finished)
+        self._task.signals.failed.connect(self._on_failed)
+        self._started_at = time.monotonic()
+        QThreadPool.globalInstance().start(self._task)
+
+    def _on_finished(self, request_id, results):
+        created_ns, self._task = self._task.created_ns, None
+        # Kaynak yavaşsa aralığı açıyoruz, hızlanınca normale dönüyoruz
+        if time.monotonic() - self._started_at > SLOW_REFRESH_SECONDS:
+            self.interval = min(self.interval * 2, MAX_REFRESH_INTERVAL_MS)
+        else:
+            self.interval = self.base_interval
+        for tab in self._live_tabs():
+            if tab.symbol in results:
+                tab.apply_refresh(request_id, results[tab.symbol])
+                tracer.record(f"refresh:{tab.symbol}", created_ns, time.perf_counter_ns())
+        self._schedule_next()
+
+    def _on_failed(self, request_id, error):
+        self._task = None
+        print(f"Toplu yenileme hatası: {error}")
+        self.interval = min(self.interval * 2, MAX_REFRESH_INTERVAL_MS)
+        self._schedule_next()
+
+    def stream(self):
+        if self.quote_source is None or self._quote_task is not None:
+            return
+        # Seans dışında gelen kotasyonlar zaten atılır; boşuna istek yapılmaz
+        if not in_session(data_provider.now()):
+            return
+        symbols = sorted({tab.symbol for tab in self._live_tabs()})
+        if not symbols:
+            return
+        self._quote_task = FetchTask(next(_request_ids), self.quote_source.quotes, symbols)
+        self._quote_task.signals.finished.connect(self._on_quotes)
+        self._quote_task.signals.failed.connect(self._on_quotes_failed)
+        QThreadPool.globalInstance().start(self._quote_task)
+
+    def _on_quotes(self, request_id, quotes):
+        self._quote_task = None
+        for tab in self._live_tabs():
+            if tab.symbol in quotes:
+                tab.apply_quote(request_id, quotes[tab.symbol])
+
+    def _on_quotes_failed(self, request_id, error):
+        self._quote_task = None
+        print(f"Kotasyon hatası: {error}")
+
+class CrosshairOverlay(QWidget):
+    # Grafiğin üstünde şeffaf katman; fare hareketinde yalnızca değişen şeritler yeniden çizilir
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        self.cross_pen = QPen(Qt.DotLine)
+        self.cross_pen.setColor(QColor(ACCENT_COLOR))
+        self.text_font = QFont("Segoe UI", 9)
+        self.metrics = QFontMetrics(self.text_font)
+        self._crosshair = None
+
+    def set_crosshair(self, crosshair):
+        if crosshair == self._crosshair:
+            return
+        dirty = self._region()
+        self._crosshair = crosshair
+        self.update(dirty.united(self._region()))
+
+    def _region(self):
+        if self._crosshair is None:
+            return QRegion()
+        x, high_y, low_y, close_y, price_text, time_text = self._crosshair
+        height = self.metrics.height() + 4
+        region = QRegion(x - 1, min(high_y, low_y) - 1, 3, abs(low_y - high_y) + 3)
+        region += QRegion(0, close_y - 1, self.width(), 3)
+        region += QRegion(self.width() - 62, close_y - self.metrics.ascent() - 2,
+                          self.metrics.horizontalAdvance(price_text) + 4, height)
+        region += QRegion(x - 2, self.height() - 10 - self.metrics.ascent() - 2,
+                          self.metrics.horizontalAdvance(time_text) + 4, height)
+        return region
+
+    @traced("crosshair_paint")
+    def paintEvent(self, event):
+        if self._crosshair is None:
+            return
+        x, high_y, low_y, close_y, price_text, time_text = self._crosshair
+        painter = QPainter(self)
+        painter.setPen(self.cross_pen)
+        painter.drawLine(x, high_y, x, low_y)
+        painter.drawLine(0, close_y, self.width(), close_y)
+        painter.setPen(QColor(ACCENT_COLOR))
+        painter.setFont(self.text_font)
+        painter.drawText(self.width() - 60, close_y, price_text)
+        painter.drawText(x, self.height() - 10, time_text)
+
 class InteractiveChartView(QChartView):
     def __init__(self, chart, series, *labels, parent=None):
         super().__init__(chart, parent)
@@ -43,8 +1556,8 @@ class InteractiveChartView(QChartView):
         self.setMouseTracking(True)
         self.setInteractive(True)
         self.series = series
-        self.candles = []
-        self._hover_candle = None  # Bu satırı ekledik
+        self.candles = CandleStore()
+        self._hover_index = None
         self._mouse_pressed = False
         self._last_mouse_pos = None
 
@@ -56,8 +1569,36 @@ class InteractiveChartView(QChartView):
          self.support2_label, self.resistance1_label,
          self.resistance2_label) = labels
 
-        self.cross_pen = QPen(Qt.DotLine)
-        self.cross_pen.setColor(QColor(ACCENT_COLOR))
+        self.crosshair = CrosshairOverlay(self.viewport())
+
+        self._pending_labels = None
+        self._label_timer = QTimer(self)
+        self._label_timer.setSingleShot(True)
+        self._label_timer.setInterval(LABEL_FRAME_MS)
+        self._label_timer.timeout.connect(self._flush_labels)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.crosshair.setGeometry(self.viewport().rect())
+        self._update_crosshair()
+
+    def set_hover_index(self, index):
+        self._hover_index = index
+        self._update_crosshair()
+
+    def _update_crosshair(self):
+        if self._hover_index is None or self._hover_index >= len(self.candles):
+            self.crosshair.set_crosshair(None)
+            return
+        c, i = self.candles, self._hover_index
+        ts = float(c.timestamp[i])
+        high_pt = self.chart().mapToPosition(QPointF(ts, c.high[i]), self.series)
+        low_pt = self.chart().mapToPosition(QPointF(ts, c.low[i]), self.series)
+        close_pt = self.chart().mapToPosition(QPointF(ts, c.close[i]), self.series)
+        self.crosshair.set_crosshair((
+            int(high_pt.x()), int(high_pt.y()), int(low_pt.y()), int(close_pt.y()),
+            f"{c.close[i]:.2f}", QDateTime.fromMSecsSinceEpoch(int(c.timestamp[i])).toString("HH:mm")
+        ))
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MiddleButton:
@@ -71,25 +1612,27 @@ class InteractiveChartView(QChartView):
             self._last_mouse_pos = None
         super().mouseReleaseEvent(event)
 
+    @traced("hover")
     def mouseMoveEvent(self, event):
         if self._mouse_pressed and self._last_mouse_pos:
             delta = event.pos() - self._last_mouse_pos
             self.chart().scroll(-delta.x(), delta.y())
             self._last_mouse_pos = event.pos()
+            self._update_crosshair()
         else:
-            if self.series and self.candles:
+            if self.series and len(self.candles):
                 pos = event.pos()
                 chart_coords = self.chart().mapToValue(pos, self.series)
-                x = chart_coords.x()
-                nearest = min(self.candles, key=lambda c: abs(c['timestamp'] - x))
-                self._hover_candle = nearest
-                self._update_labels(nearest)
+                nearest = self.candles.nearest(chart_coords.x())
             else:
-                self._hover_candle = None
-                self._update_labels(None)
-            self.viewport().update()
+                nearest = None
+            # Fare aynı mumun üzerindeyse etiketleri ve çizimi yenilemeye gerek yok
+            if nearest != self._hover_index:
+                self.set_hover_index(nearest)
+                self._update_labels(nearest)
         super().mouseMoveEvent(event)
 
+    @traced("wheel")
     def wheelEvent(self, event):
         factor = 1.1 if event.angleDelta().y() > 0 else 0.9
         mouse_pos = event.pos()
@@ -98,24 +1641,9 @@ class InteractiveChartView(QChartView):
         after_zoom_pos = self.chart().mapToPosition(chart_pos, self.series)
         delta = mouse_pos - after_zoom_pos
         self.chart().scroll(delta.x(), -delta.y())
+        self._update_crosshair()
         super().wheelEvent(event)
 
-    def paintEvent(self, event):
-        super().paintEvent(event)
-        if self._hover_candle:
-            painter = QPainter(self.viewport())
-            painter.setPen(self.cross_pen)
-            high_pt = self.chart().mapToPosition(QPointF(self._hover_candle['timestamp'], self._hover_candle['high']), self.series)
-            low_pt = self.chart().mapToPosition(QPointF(self._hover_candle['timestamp'], self._hover_candle['low']), self.series)
-            painter.drawLine(int(high_pt.x()), int(high_pt.y()), int(low_pt.x()), int(low_pt.y()))
-            close_pt = self.chart().mapToPosition(QPointF(self._hover_candle['timestamp'], self._hover_candle['close']), self.series)
-            painter.drawLine(0, int(close_pt.y()), self.viewport().width(), int(close_pt.y()))
-            painter.setPen(QColor(ACCENT_COLOR))
-            painter.setFont(QFont("Segoe UI", 9))
-            painter.drawText(self.viewport().width() - 60, int(close_pt.y()), f"{self._hover_candle['close']:.2f}")
-            painter.drawText(int(close_pt.x()), self.viewport().height() - 10,
-                             QDateTime.fromMSecsSinceEpoch(int(self._hover_candle['timestamp'])).toString("HH:mm"))
-
     def format_volume(self, value):
         if value >= 1_000_000:
             return f"{value / 1_000_000:.2f}M"
@@ -135,44 +1663,63 @@ class InteractiveChartView(QChartView):
         else:
             return f"{value:.2f}"
 
-    def _update_labels(self, candle):
+    @staticmethod
+    def _set_tone(label, tone):
+        # Renkler etiket stilindeki [tone=...] seçicilerinde; stil yalnızca ton değişince yeniden uygulanır
+        if label.property("tone") != tone:
+            label.setProperty("tone", tone)
+            label.style().unpolish(label)
+            label.style().polish(label)
+
+    def _update_labels(self, index):
+        self._pending_labels = index
+        if not self._label_timer.isActive():
+            self._label_timer.start()
+
+    def _flush_labels(self):
+        index = self._pending_labels
+        if index is not None and index >= len(self.candles):
+            index = None
         labels = [
             self.open_label, self.close_label, self.change_label,
             self.high_label, self.low_label, self.rsi_label,
             self.volume_label, self.total_volume_label, self.money_flow_label,
             self.ma20_label, self.ma50_label, self.ma200_label,
         ]
-        if candle is None:
+        if index is None:
             for lbl in labels:
                 lbl.setText(lbl.text().split(":")[0] + ": -")
-                lbl.setStyleSheet(f"background-color: {HIGHLIGHT_COLOR}; color: {TEXT_COLOR}; padding: 6px; border-radius: 4px;")
+            for lbl in (self.change_label, self.rsi_label, self.money_flow_label):
+                self._set_tone(lbl, "")
         else:
-            self.open_label.setText(f"Açılış: {candle['open']:.2f}")
-            self.close_label.setText(f"Kapanış: {candle['close']:.2f}")
+            c = self.candles
+            open_, close = c.open[index], c.close[index]
+            self.open_label.setText(f"Açılış: {open_:.2f}")
+            self.close_label.setText(f"Kapanış: {close:.2f}")
             
-            change = candle['close'] - candle['open']
-            change_color = GREEN_COLOR if change >= 0 else RED_COLOR
+            change = close - open_
             self.change_label.setText(f"Değişim: {change:+.2f}")
-            self.change_label.setStyleSheet(f"background-color: {HIGHLIGHT_COLOR}; color: {change_color}; padding: 6px; border-radius: 4px;")
+            self._set_tone(self.change_label, "up" if change >= 0 else "down")
             
-            self.high_label.setText(f"Üst Fitil: {candle['high']:.2f}")
-            self.low_label.setText(f"Alt Fitil: {candle['low']:.2f}")
+            self.high_label.setText(f"Üst Fitil: {c.high[index]:.2f}")
+            self.low_label.setText(f"Alt Fitil: {c.low[index]:.2f}")
             
-            rsi_color = RED_COLOR if candle['rsi'] <= 30 else GREEN_COLOR if candle['rsi'] >= 70 else ACCENT_COLOR
-            self.rsi_label.setText(f"RSI: {candle['rsi']:.2f} ({candle['rsi_region']})")
-            self.rsi_label.setStyleSheet(f"background-color: {HIGHLIGHT_COLOR}; color: {rsi_color}; padding: 6px; border-radius: 4px;")
+            rsi = float(c.rsi[index])
+            self.rsi_label.setText(f"RSI: {rsi:.2f} ({rsi_region(rsi)})")
+            self._set_tone(self.rsi_label, "down" if rsi <= 30 else "up" if rsi >= 70 else "neutral")
             
-            self.volume_label.setText(f"Hacim: {candle['formatted_volume']}")
-            self.total_volume_label.setText(f"Toplam Hacim: {candle['formatted_total_volume']}")
+            self.volume_label.setText(f"Hacim: {self.format_volume(c.volume[index])}")
+            self.total_volume_label.setText(f"Toplam Hacim: {self.format_volume(c.total_volume[index])}")
             
-            mf = self.format_money(candle['cumulative_money_flow'])
-            color = GREEN_COLOR if candle['cumulative_money_flow'] >= 0 else RED_COLOR
+            money_flow = c.money_flow[index]
+            mf = self.format_money(money_flow)
             self.money_flow_label.setText(f"Para Akışı: {mf}")
-            self.money_flow_label.setStyleSheet(f"background-color: {HIGHLIGHT_COLOR}; color: {color}; padding: 6px; border-radius: 4px;")
+            self._set_tone(self.money_flow_label, "up" if money_flow >= 0 else "down")
             
-            self.ma20_label.setText(f"MA20: {candle['ma20']:.2f}" if 'ma20' in candle and pd.notna(candle['ma20']) else "MA20: -")
-            self.ma50_label.setText(f"MA50: {candle['ma50']:.2f}" if 'ma50' in candle and pd.notna(candle['ma50']) else "MA50: -")
-            self.ma200_label.setText(f"MA200: {candle['ma200']:.2f}" if 'ma200' in candle and pd.notna(candle['ma200']) else "MA200: -")
+            for lbl, name, values in ((self.ma20_label, "MA20", c.ma20), (self.ma50_label, "MA50", c.ma50),
+                                      (self.ma200_label, "MA200", c.ma200)):
+                value = values[index]
+                lbl.setText(f"{name}: {value:.2f}" if not np.isnan(value) else f"{name}: -")
 
 class StockChartTab(QWidget):
     def __init__(self, name, symbol):
@@ -186,10 +1733,10 @@ class StockChartTab(QWidget):
         main_layout.setSpacing(15)
         
         # Başlık
-        title_label = QLabel(f"{self.name} ({self.symbol})")
-        title_label.setStyleSheet(f"font-size: 18px; font-weight: bold; color: {ACCENT_COLOR};")
-        title_label.setAlignment(Qt.AlignCenter)
-        main_layout.addWidget(title_label)
+        self.title_label = QLabel(f"{self.name} ({self.symbol})")
+        self.title_label.setStyleSheet(f"font-size: 18px; font-weight: bold; color: {ACCENT_COLOR};")
+        self.title_label.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(self.title_label)
         
         # Kontrol paneli
         control_frame = QFrame()
@@ -280,11 +1827,24 @@ class StockChartTab(QWidget):
             }}
         """)
         self.view_button.clicked.connect(self.update_chart)
+        self.date_combo.currentIndexChanged.connect(self._on_date_changed)
         
         date_layout.addWidget(self.date_combo)
         date_layout.addWidget(self.view_button)
         self.date_group.setLayout(date_layout)
         control_layout.addWidget(self.date_group)
+
+        # Zaman dilimi: üst dilimler eldeki dakikalık mumlardan üretilir, ağa çıkılmaz
+        self.timeframe_group = QGroupBox("Zaman Dilimi")
+        self.timeframe_group.setStyleSheet(self.mode_group.styleSheet())
+        timeframe_layout = QHBoxLayout()
+        self.timeframe_combo = QComboBox()
+        self.timeframe_combo.addItems(list(TIMEFRAMES))
+        self.timeframe_combo.setStyleSheet(self.date_combo.styleSheet())
+        self.timeframe_combo.currentTextChanged.connect(self._on_timeframe_changed)
+        timeframe_layout.addWidget(self.timeframe_combo)
+        self.timeframe_group.setLayout(timeframe_layout)
+        control_layout.addWidget(self.timeframe_group)
         
         control_layout.addStretch()
         main_layout.addWidget(control_frame)
@@ -310,6 +1870,9 @@ class StockChartTab(QWidget):
                     border-radius: 4px;
                     font-family: 'Segoe UI';
                 }}
+                QLabel[tone="up"] {{ color: {GREEN_COLOR}; }}
+                QLabel[tone="down"] {{ color: {RED_COLOR}; }}
+                QLabel[tone="neutral"] {{ color: {ACCENT_COLOR}; }}
             """)
             lbl.setFont(QFont("Segoe UI", 10))
             return lbl
@@ -402,13 +1965,39 @@ class StockChartTab(QWidget):
         
         self.setLayout(main_layout)
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_chart)
-        self.timer.start(60000)
-        
+        self._tasks = {}
+        self.calendar = TradingCalendar()
+        self._intraday = None
+        self._prefetch = None
+        self._stale = False
+        self._rendered_request = 0
+        self._last_set = None
+        self._series_live = None
+        self._candles_version = 0
+        self._shown = CandleStore()
+        self._shown_lines = {}
+        self._shown_key = None
+        self._source = CandleStore()
+        self._resampler = None
+
+        # Yakınlaştırma/kaydırma sonrası seriler görünen aralığa göre yeniden özetlenir
+        self._lod_timer = QTimer(self)
+        self._lod_timer.setSingleShot(True)
+        self._lod_timer.setInterval(LOD_REFRESH_DELAY_MS)
+        self._lod_timer.timeout.connect(self._refresh_series)
+        self.axisX.rangeChanged.connect(self._schedule_lod)
+        self.chart.plotAreaChanged.connect(self._schedule_lod)
+
+        # Sekme hemen görünür; tarih listesi ve ilk veri arka planda paralel yüklenir
+        self._calendar_task = None
         self.load_historical_dates()
         self.update_chart()
 
+    def set_name(self, name):
+        self.name = name
+        self.title_label.setText(f"{self.name} ({self.symbol})")
+        self.chart.setTitle(f"{self.name} ({self.symbol})")
+
     def _create_ma_series(self, color, name):
         series = QLineSeries()
         series.setName(name)
@@ -422,243 +2011,593 @@ class StockChartTab(QWidget):
     def toggle_data_mode(self, live_checked):
         self.date_combo.setEnabled(not live_checked)
         self.view_button.setEnabled(not live_checked)
-        if live_checked:
-            self.timer.start(60000)
-            self.axisX.setFormat("HH:mm")
-        else:
-            self.timer.stop()
-            self.axisX.setFormat("dd MMM")
+        self.cancel_pending()
         self.update_chart()
 
     def load_historical_dates(self):
+        task = FetchTask(next(_request_ids), load_trading_calendar, self.symbol)
+        task.signals.finished.connect(self._on_dates_loaded)
+        task.signals.failed.connect(self._on_dates_failed)
+        self._calendar_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_dates_loaded(self, request_id, calendar):
+        self.calendar = calendar
+        if len(self.calendar):
+            self.date_combo.clear()
+            self.date_combo.addItems(self.calendar.labels(HISTORY_DATE_COUNT))
+            if not self.live_radio.isChecked():
+                self.update_chart()
+
+    def _on_dates_failed(self, request_id, error):
+        print(f"Tarih yükleme hatası: {error}")
+
+    def update_chart(self):
+        if self.live_radio.isChecked():
+            self._submit(load_cached_live_data, self.symbol)
+            self._submit(load_live_data, self.symbol)
+        else:
+            selected_date = self.date_combo.currentText()
+            if not selected_date:
+                return
+            if self._intraday is None:
+                # Ön yükleme bitince bu metot yeniden çağrılır
+                if self._prefetch is None:
+                    self._prefetch_intraday()
+            elif selected_date in self._intraday:
+                self.cancel_pending()
+                self._rendered_request = next(_request_ids)
+                self._show_result(self._intraday[selected_date])
+            else:
+                self._submit(load_historical_data, self.symbol, selected_date, self.calendar)
+
+    def _prefetch_intraday(self):
+        task = FetchTask(next(_request_ids), load_intraday_history, self.symbol,
+                         self.calendar.labels(HISTORY_DATE_COUNT))
+        task.signals.finished.connect(self._on_intraday_loaded)
+        task.signals.failed.connect(self._on_intraday_failed)
+        self._prefetch = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_intraday_loaded(self, request_id, results):
+        self._intraday = results
+        if not self.live_radio.isChecked():
+            self.update_chart()
+
+    def _on_intraday_failed(self, request_id, error):
+        # Gün içi veri yoksa seçilen günün günlük barı gösterilir
+        print(f"Gün içi geçmiş yükleme hatası: {error}")
+        self._on_intraday_loaded(request_id, {})
+
+    def _on_date_changed(self, index):
+        if not self.live_radio.isChecked() and self._intraday and self.date_combo.currentText() in self._intraday:
+            self.update_chart()
+
+    def _submit(self, func, *args):
+        task = FetchTask(next(_request_ids), func, *args)
+        task.signals.finished.connect(self._on_fetch_finished)
+        task.signals.failed.connect(self._on_fetch_failed)
+        self._tasks[task.request_id] = task
+        QThreadPool.globalInstance().start(task)
+
+    def cancel_pending(self):
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+
+    def shutdown(self):
+        # Kapatılan sekme: bekleyen işler iptal edilir, sonuçları bu sekmeye hiç ulaşmaz,
+        # seriler ve mum tamponları bırakılır. Kuyruktaki görevleri havuz tutar; burada
+        # bırakılan başvurular onları silmez (leak_check.py bu durumu sınar).
+        self._lod_timer.stop()
+        tasks = list(self._tasks.values()) + [t for t in (self._prefetch, self._calendar_task) if t is not None]
+        for task in tasks:
+            task.cancel()
+            for signal in (task.signals.finished, task.signals.failed):
+                try:
+                    signal.disconnect()
+                except TypeError:
+                    pass
+        self._tasks.clear()
+        self._prefetch = self._calendar_task = None
+
+        for series in (self.series, self.ma20_series, self.ma50_series, self.ma200_series):
+            series.clear()
+        self.chart_view.set_hover_index(None)
+        self.chart_view.candles = CandleStore()
+        self._shown, self._shown_lines, self._last_set = CandleStore(), {}, None
+        self._source = CandleStore()
+        if self._resampler is not None:
+            self._resampler.reset()
+        self._intraday = None
+        self.calendar = TradingCalendar()
+        discard_indicator_engine(self.symbol)
+
+    def _accept_result(self, request_id):
+        # İptal edilmiş ya da daha yeni bir isteğin sonucu zaten çizilmişse yok say
+        if self._tasks.pop(request_id, None) is None:
+            return False
+        if request_id < self._rendered_request:
+            return False
+        self._rendered_request = request_id
+        return True
+
+    def wants_live_refresh(self):
+        return self.live_radio.isChecked()
+
+    def is_on_screen(self):
+        return self.isVisible() and not self.window().isMinimized()
+
+    def mark_stale(self):
+        self._stale = True
+
+    def catch_up(self):
+        # Gizliyken kaçırılan yenilemeler tek bir delta yüklemesi ve artımlı çizimle telafi edilir
+        if not self._stale or not self.live_radio.isChecked() or not self.is_on_screen():
+            return
+        self._stale = False
+        if not self._tasks:
+            self._submit(load_live_data, self.symbol)
+
+    def apply_refresh(self, request_id, result):
+        # Ortak zamanlayıcıdan gelen sonuç; bu sekmenin daha yeni bir sonucu çizildiyse atla
+        if not self.live_radio.isChecked() or request_id < self._rendered_request:
+            return
+        self._rendered_request = request_id
+        if isinstance(result, Exception):
+            self._show_error(result)
+        else:
+            self._show_result(result)
+
+    def _on_fetch_failed(self, request_id, error):
+        if self._accept_result(request_id):
+            self._show_error(error)
+
+    def _on_fetch_finished(self, request_id, result):
+        task = self._tasks.get(request_id)
+        if self._accept_result(request_id):
+            self._show_result(result)
+            # Sekme yenileme gecikmesi: isteğin oluşturulmasından çizimin bitmesine kadar
+            if result is not None:
+                tracer.record(f"refresh:{self.symbol}", task.created_ns, time.perf_counter_ns())
+
+    def _show_error(self, error):
+        if isinstance(error, NoDataError):
+            QMessageBox.warning(self, "Uyarı", str(error))
+        elif self.live_radio.isChecked():
+            QMessageBox.warning(self, "Hata", f"Canlı veri alınamadı: {str(error)}")
+        else:
+            QMessageBox.warning(self, "Hata", f"Geçmiş veri alınamadı: {str(error)}")
+
+    def _show_result(self, result):
+        if result is None:
+            return
+        if result["notice"]:
+            QMessageBox.information(self, "Bilgi", result["notice"])
         try:
-            symbol = self.symbol + ".IS"
-            stock = yf.Ticker(symbol)
-            
-            end_date = datetime.now(timezone("Europe/Istanbul"))
-            start_date = end_date - timedelta(days=45)
-            
-            data = stock.history(start=start_date, end=end_date, interval="1d")
-            
-            if not data.empty:
-                valid_dates = []
-                for date in data.index:
-                    if not pd.isna(data.loc[date, 'Close']):
-                        date_str = date.strftime('%Y-%m-%d')
-                        valid_dates.append(date_str)
-                
-                self.date_combo.clear()
-                self.date_combo.addItems(valid_dates[-30:])
-        
+            self.render_data(result["data"], result["candles"], result["live"], result["pivot_date"])
         except Exception as e:
-            print(f"Tarih yükleme hatası: {e}")
+            QMessageBox.critical(self, "Hata", f"Grafik güncellenirken hata oluştu: {str(e)}")
+
+    @staticmethod
+    def _candle_sets(candles, start=0):
+        return [
+            QCandlestickSet(o, h, l, c, t) for o, h, l, c, t in zip(
+                candles.open[start:].tolist(), candles.high[start:].tolist(), candles.low[start:].tolist(),
+                candles.close[start:].tolist(), candles.timestamp[start:].astype(float).tolist())
+        ]
+
+    @staticmethod
+    def _line_points(timestamps, values):
+        mask = ~np.isnan(values)
+        return [QPointF(t, v) for t, v in zip(timestamps[mask].astype(float).tolist(),
+                                             values[mask].astype(float).tolist())]
+
+    def _update_series(self, old, new, old_lines, new_lines):
+        n = len(old)
+        # Canlı tikte önceki mumlar aynıysa yalnızca oluşan son mum güncellenir, yeniler eklenir
+        incremental = (
+            n and self._last_set is not None and len(new) >= n
+            and np.array_equal(new.timestamp[:n], old.timestamp)
+            and all(np.array_equal(getattr(new, col)[:n - 1], getattr(old, col)[:n - 1])
+                    for col in ("open", "high", "low", "close"))
+        )
+        if incremental:
+            self._last_set.setOpen(new.open[n - 1])
+            self._last_set.setHigh(new.high[n - 1])
+            self._last_set.setLow(new.low[n - 1])
+            self._last_set.setClose(new.close[n - 1])
+            sets = self._candle_sets(new, n)
+        else:
+            self.series.clear()
+            sets = self._candle_sets(new)
+            self._last_set = None
+        if sets:
+            self.series.append(sets)
+            self._last_set = sets[-1]
+
+        for line, name in ((self.ma20_series, "ma20"), (self.ma50_series, "ma50"), (self.ma200_series, "ma200")):
+            old_ts, old_values = old_lines.get(name, (np.empty(0), np.empty(0)))
+            ts, values = new_lines[name]
+            m = len(old_ts)
+            if (incremental and len(ts) >= m and np.array_equal(ts[:m], old_ts)
+                    and np.array_equal(values[:m], old_values, equal_nan=True)):
+                line.append(self._line_points(ts[m:], values[m:]))
+            else:
+                line.replace(self._line_points(ts, values))
+
+    def _display_range(self, candles):
+        # Görünen aralık ve iki yanında yarım ekranlık pay; kova boyu piksel genişliğine göre
+        ts = candles.timestamp
+        lo = self.axisX.min().toMSecsSinceEpoch()
+        hi = self.axisX.max().toMSecsSinceEpoch()
+        margin = (hi - lo) // 2
+        visible = int(np.searchsorted(ts, hi, "right") - np.searchsorted(ts, lo))
+        budget = max(LOD_MIN_BUCKETS, int(self.chart.plotArea().width() / LOD_MIN_CANDLE_PX))
+        size = max(1, math.ceil(visible / budget))
+        start = int(np.searchsorted(ts, lo - margin)) // size * size
+        stop = int(np.searchsorted(ts, hi + margin, "right"))
+        return start, stop, size
+
+    def _display_candles(self, source):
+        self._source = source
+        return self._resampler.update(source) if self._resampler is not None else source
+
+    def _on_timeframe_changed(self, timeframe):
+        minutes = TIMEFRAMES[timeframe]
+        self._resampler = CandleResampler(minutes) if minutes > 1 else None
+        if not len(self._source):
+            return
+        self._candles_version += 1
+        self.chart_view.candles = self._display_candles(self._source)
+        self.chart_view.set_hover_index(None)
+        self._refresh_series()
 
-    def filter_market_hours(self, data):
+    def _schedule_lod(self, *args):
+        self._lod_timer.start()
+
+    @traced("series")
+    def _refresh_series(self):
+        candles = self.chart_view.candles
+        start, stop, size = self._display_range(candles)
+        key = (self._candles_version, start, stop, size)
+        if key == self._shown_key:
+            return
+        if size == 1:
+            shown = candles.slice(start, stop)
+        else:
+            shown = aggregate_candles(candles, start, stop, size)
+        lines = {}
+        for name in ("ma20", "ma50", "ma200"):
+            values = getattr(candles, name)
+            idx = minmax_decimate(values, start, stop, size)
+            lines[name] = (candles.timestamp[idx], values[idx])
+        self._update_series(self._shown, shown, self._shown_lines, lines)
+        self._shown, self._shown_lines, self._shown_key = shown, lines, key
+
+    @traced("quote")
+    def apply_quote(self, request_id, quote):
+        # Son tam yüklemeden önce istenmiş kotasyonlar eskidir; dakikalık kaynak güncellenir
+        candles = self._source
+        if not self.live_radio.isChecked() or request_id <= self._rendered_request or not len(candles):
+            return
+        when, price, volume = quote
+        minute = when.floor("min")
+        if not in_session(minute):
+            return
+        ts = int(wall_clock_msecs(pd.DatetimeIndex([minute]))[0])
+        last_ts = int(candles.timestamp[-1])
+        # Yeni işlem günü tam yenilemeyle gelir
+        if ts < last_ts or QDateTime.fromMSecsSinceEpoch(last_ts).date().toPyDate() != minute.date():
+            return
+
+        # Günlük göstergeler bugünün barı fiyatla revize edilerek O(1) güncellenir
+        engine = indicator_engine(self.symbol)
+        with engine.lock:
+            if engine.last_index is not None and engine.last_index.date() == minute.date():
+                engine.update(engine.last_index, {"Close": price})
+            values = engine.values()
+
+        i = len(candles) - 1
+        if ts == last_ts:
+            bar = (candles.open[i], max(candles.high[i], price), min(candles.low[i], price),
+                   price, max(candles.volume[i], volume))
+        else:
+            bar = (price, price, price, price, volume)
+        candles = candles.with_bar(ts, *bar, rsi=values["RSI"], ma20=values["MA20"],
+                                   ma50=values["MA50"], ma200=values["MA200"])
+
+        self._candles_version += 1
+        shown = len(self.chart_view.candles) - 1
+        self.chart_view.candles = self._display_candles(candles)
+        if self.axisX.max().toMSecsSinceEpoch() >= last_ts:
+            self.axisX.setMax(QDateTime.fromMSecsSinceEpoch(ts))
+        if not (self.axisY.min() <= price <= self.axisY.max()):
+            self.axisY.setRange(min(self.axisY.min(), price * 0.98), max(self.axisY.max(), price * 1.02))
+        self._refresh_series()
+
+        hover = self.chart_view._hover_index
+        if hover is not None and hover >= shown:
+            self.chart_view.set_hover_index(hover)
+            self.chart_view._update_labels(hover)
+
+    @traced("render")
+    def render_data(self, data, candles, live, pivot_date):
         if data.empty:
-            return data
-            
-        try:
-            if len(data.index.normalize().unique()) < len(data.index):
-                if data.index.tz is None:
-                    data.index = data.index.tz_localize('UTC')
-                data.index = data.index.tz_convert('Europe/Istanbul')
-                return data.between_time('09:55', '18:05')
-            return data
-        except Exception as e:
-            print(f"Zaman filtreleme hatası: {e}")
-            return data
+            QMessageBox.warning(self, "Uyarı", f"{self.symbol}.IS için veri bulunamadı")
+            return
+
+        if self._series_live != live:
+            self._shown, self._shown_lines = CandleStore(), {}
+        self._series_live = live
+        self._candles_version += 1
+        source = candles
+        candles = self.chart_view.candles = self._display_candles(source)
+        self.chart_view.set_hover_index(None)
+
+        ts = candles.timestamp
+        l, h = candles.low, candles.high
 
-    def update_chart(self):
         try:
-            now = datetime.now(timezone("Europe/Istanbul"))
-            symbol = self.symbol + ".IS"
-            stock = yf.Ticker(symbol)
-            
-            if self.live_radio.isChecked():
-                try:
-                    full_data = stock.history(period="1y", interval="1d")
-                    full_data = full_data[~pd.isna(full_data['Close'])]
-                    
-                    if len(full_data) < 200:
-                        full_data = stock.history(period="2y", interval="1d")
-                        full_data = full_data[~pd.isna(full_data['Close'])]
-                    
-                    full_data = full_data.iloc[-200:]
-                    
-                    data = stock.history(period="1d", interval="1m")
-                    if data.empty:
-                        data = stock.history(start=(now - timedelta(days=1)).strftime('%Y-%m-%d'), interval="1m")
-                    data = self.filter_market_hours(data)
-                    
-                    full_data["MA20"] = full_data["Close"].rolling(window=20, min_periods=1).mean()
-                    full_data["MA50"] = full_data["Close"].rolling(window=50, min_periods=1).mean()
-                    full_data["MA200"] = full_data["Close"].rolling(window=200, min_periods=1).mean()
-                    full_data["RSI"] = calculate_rsi(full_data)
-                    
-                    last_ma_values = full_data.iloc[-1][["MA20", "MA50", "MA200", "RSI"]]
-                    data = data.assign(**{col: last_ma_values[col] for col in ["MA20", "MA50", "MA200", "RSI"]})
-                    
-                except Exception as e:
-                    QMessageBox.warning(self, "Hata", f"Canlı veri alınamadı: {str(e)}")
-                    return
+            # Gün içi barı olmayan geçmiş günler tek günlük mum olarak çizilir
+            if not live and len(source) == 1:
+                self.axisX.setFormat("dd MMM")
+                min_time = QDateTime(data.index[0].to_pydatetime().date(), QTime(0, 0))
+                max_time = QDateTime(data.index[0].to_pydatetime().date(), QTime(23, 59))
+                self.axisX.setRange(min_time, max_time)
             else:
-                selected_date = self.date_combo.currentText()
-                if not selected_date:
-                    return
-                
-                try:
-                    target_date = pd.to_datetime(selected_date)
-                    
-                    data = stock.history(
-                        start=target_date - timedelta(days=1),
-                        end=target_date + timedelta(days=1),
-                        interval="1d"
-                    )
-                    
-                    if data.empty:
-                        QMessageBox.warning(self, "Uyarı", f"{selected_date} tarihli veri bulunamadı")
-                        return
-                    
-                    data = data[data.index.normalize() == target_date.normalize()]
-                    
-                    if data.empty:
-                        for days_back in range(1, 6):
-                            prev_date = target_date - timedelta(days=days_back)
-                            prev_data = stock.history(
-                                start=prev_date - timedelta(days=1),
-                                end=prev_date + timedelta(days=1),
-                                interval="1d"
-                            )
-                            if not prev_data.empty:
-                                data = prev_data[prev_data.index.normalize() == prev_date.normalize()]
-                                if not data.empty:
-                                    QMessageBox.information(
-                                        self, "Bilgi", 
-                                        f"{selected_date} tarihinde işlem yok. En yakın işlem günü ({prev_date.date()}) gösteriliyor."
-                                    )
-                                    target_date = prev_date
-                                    break
-                        
-                        if data.empty:
-                            QMessageBox.warning(self, "Uyarı", f"{selected_date} tarihi için veri bulunamadı")
-                            return
-                    
-                    full_data = stock.history(
-                        start=target_date - timedelta(days=300),
-                        end=target_date + timedelta(days=1),
-                        interval="1d"
-                    )
-                    
-                    full_data = full_data[~pd.isna(full_data['Close'])]
-                    full_data = full_data.iloc[-200:]
-                    
-                    full_data["MA20"] = full_data["Close"].rolling(window=20, min_periods=1).mean()
-                    full_data["MA50"] = full_data["Close"].rolling(window=50, min_periods=1).mean()
-                    full_data["MA200"] = full_data["Close"].rolling(window=200, min_periods=1).mean()
-                    full_data["RSI"] = calculate_rsi(full_data)
-                    
-                    last_ma_values = full_data.iloc[-1][["MA20", "MA50", "MA200", "RSI"]]
-                    data = data.assign(**{col: last_ma_values[col] for col in ["MA20", "MA50", "MA200", "RSI"]})
-                
-                except Exception as e:
-                    QMessageBox.warning(self, "Hata", f"Geçmiş veri alınamadı: {str(e)}")
-                    return
-            
-            if data.empty:
-                QMessageBox.warning(self, "Uyarı", f"{symbol} için veri bulunamadı")
-                return
+                self.axisX.setFormat("HH:mm")
+                self.axisX.setRange(
+                    QDateTime.fromMSecsSinceEpoch(int(ts[0])),
+                    QDateTime.fromMSecsSinceEpoch(int(source.timestamp[-1]))
+                )
+            self.axisY.setRange(np.nanmin(l) * 0.98, np.nanmax(h) * 1.02)
+        except Exception as e:
+            print(f"Eksen ayarlama hatası: {e}")
 
-            self.series.clear()
-            self.ma20_series.clear()
-            self.ma50_series.clear()
-            self.ma200_series.clear()
-            self.chart_view.candles.clear()
+        self._refresh_series()
+
+        # Pivot hesaplamaları
+        pivot_data = data[data.index.date == pivot_date]
+
+        if pivot_data.empty:
+            pivot_data = data
+
+        high = pivot_data["High"].max()
+        low = pivot_data["Low"].min()
+        close = pivot_data["Close"].iloc[-1] if not pivot_data.empty else 0
+        pivot = (high + low + close) / 3
+        s1 = (2 * pivot) - high
+        s2 = pivot - (high - low)
+        r1 = (2 * pivot) - low
+        r2 = pivot + (high - low)
+
+        self.pivot_label.setText(f"Pivot: {pivot:.2f}")
+        self.support1_label.setText(f"Destek 1: {s1:.2f}")
+        self.support2_label.setText(f"Destek 2: {s2:.2f}")
+        self.resistance1_label.setText(f"Direnç 1: {r1:.2f}")
+        self.resistance2_label.setText(f"Direnç 2: {r2:.2f}")
+
+
+class ScreenerTab(QWidget):
+    open_symbol = pyqtSignal(str)
+
+    COLUMNS = [
+        ("Sembol", None), ("Ad", "name"), ("Kapanış", "close"), ("Değişim %", "change"), ("RSI", "rsi"),
+        ("MA20", "ma20"), ("MA50", "ma50"), ("MA200", "ma200"), ("Pivot", "pivot"),
+        ("Destek 1", "s1"), ("Direnç 1", "r1"), ("Sinyal", "cross")
+    ]
+    FILTERS = {
+        "Tümü": lambda r: r["close"].notna(),
+        "RSI < 30": lambda r: r["rsi"] < 30,
+        "RSI > 70": lambda r: r["rsi"] > 70,
+        "MA200 yukarı kesişim": lambda r: r["cross"] > 0,
+        "MA200 aşağı kesişim": lambda r: r["cross"] < 0,
+        "MA200 üzerinde": lambda r: r["close"] > r["ma200"],
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.symbol = None
+        self._task = None
+        self._results = None
+
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(10, 10, 10, 10)
+        main_layout.setSpacing(15)
+
+        control_frame = QFrame()
+        control_frame.setStyleSheet(f"background-color: {DARKER_BACKGROUND}; border-radius: 8px;")
+        control_layout = QHBoxLayout(control_frame)
+        control_layout.setContentsMargins(15, 10, 15, 10)
+
+        title_label = QLabel("BIST Tarayıcı")
+        title_label.setStyleSheet(f"font-size: 18px; font-weight: bold; color: {ACCENT_COLOR};")
+
+        self.filter_combo = QComboBox()
+        self.filter_combo.addItems(self.FILTERS)
+        self.filter_combo.setStyleSheet(f"""
+            QComboBox {{
+                background-color: {HIGHLIGHT_COLOR};
+                color: {TEXT_COLOR};
+                border: 1px solid {HIGHLIGHT_COLOR};
+                border-radius: 4px;
+                padding: 6px;
+                min-width: 160px;
+            }}
+        """)
+        self.filter_combo.currentIndexChanged.connect(self._fill_table)
+
+        self.scan_button = QPushButton("Tara")
+        self.scan_button.setStyleSheet(f"""
+            QPushButton {{
+                background-color: {ACCENT_COLOR};
+                color: white;
+                border: none;
+                border-radius: 4px;
+                padding: 8px 16px;
+                font-weight: bold;
+            }}
+            QPushButton:disabled {{
+                background-color: {HIGHLIGHT_COLOR};
+                color: #888;
+            }}
+            QPushButton:hover {{
+                background-color: #3a7bd5;
+            }}
+        """)
+        self.scan_button.clicked.connect(self.scan)
+
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet(f"color: {TEXT_COLOR};")
+
+        control_layout.addWidget(title_label)
+        control_layout.addStretch()
+        control_layout.addWidget(self.status_label)
+        control_layout.addWidget(self.filter_combo)
+        control_layout.addWidget(self.scan_button)
+        main_layout.addWidget(control_frame)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels([title for title, _ in self.COLUMNS])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setStyleSheet(f"""
+            QTableWidget {{
+                background-color: {DARKER_BACKGROUND};
+                color: {TEXT_COLOR};
+                gridline-color: {HIGHLIGHT_COLOR};
+                border: none;
+            }}
+            QHeaderView::section {{
+                background-color: {HIGHLIGHT_COLOR};
+                color: {TEXT_COLOR};
+                padding: 6px;
+                border: none;
+            }}
+        """)
+        self.table.cellDoubleClicked.connect(self._on_row_activated)
+        main_layout.addWidget(self.table, 1)
+
+        self.scan()
 
-            cumulative_money_flow = 0
-            min_p, max_p = float("inf"), float("-inf")
+    def scan(self):
+        if self._task is not None:
+            return
+        symbols = symbol_index.symbols()
+        self.scan_button.setEnabled(False)
+        self.status_label.setText(f"{len(symbols)} hisse taranıyor...")
+        self._started_at = time.monotonic()
+        self._task = FetchTask(next(_request_ids), screener.run, symbols)
+        self._task.signals.finished.connect(self._on_scanned)
+        self._task.signals.failed.connect(self._on_scan_failed)
+        QThreadPool.globalInstance().start(self._task)
 
-            for idx, row in data.iterrows():
-                if self.historical_radio.isChecked():
-                    dt = datetime.combine(idx.to_pydatetime().date(), datetime.min.time())
+    def _on_scanned(self, request_id, results):
+        self._task = None
+        self._results = results
+        self.scan_button.setEnabled(True)
+        self.status_label.setText(
+            f"{len(results)} hisse, {time.monotonic() - self._started_at:.1f} sn"
+        )
+        self._fill_table()
+
+    def _on_scan_failed(self, request_id, error):
+        self._task = None
+        self.scan_button.setEnabled(True)
+        self.status_label.setText("")
+        QMessageBox.warning(self, "Hata", f"Tarama yapılamadı: {str(error)}")
+
+    def _fill_table(self):
+        if self._results is None:
+            return
+        rows = self._results[self.FILTERS[self.filter_combo.currentText()](self._results)]
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(rows))
+        for row, (symbol, values) in enumerate(rows.iterrows()):
+            for column, (_, key) in enumerate(self.COLUMNS):
+                item = QTableWidgetItem()
+                if key is None:
+                    item.setText(symbol)
+                elif key == "name":
+                    item.setText(values["name"])
+                elif key == "cross":
+                    item.setText({1: "MA200 ↑", -1: "MA200 ↓"}.get(int(values["cross"]), ""))
+                    item.setForeground(QColor(GREEN_COLOR if values["cross"] > 0 else RED_COLOR))
+                elif pd.isna(values[key]):
+                    item.setText("-")
                 else:
-                    dt = idx.to_pydatetime()
-                
-                ts = QDateTime(dt).toMSecsSinceEpoch()
-                o, h, l, c, v = row["Open"], row["High"], row["Low"], row["Close"], row["Volume"]
-                rsi = row.get("RSI", float('nan'))
-                ma20 = row.get("MA20", float('nan'))
-                ma50 = row.get("MA50", float('nan'))
-                ma200 = row.get("MA200", float('nan'))
-                rsi_region = "Aşırı Alım" if rsi >= 70 else "Aşırı Satım" if rsi <= 30 else "Normal"
-                money_flow = c * v
-                cumulative_money_flow += money_flow
-                formatted_volume = self.chart_view.format_volume(v)
-                total_volume = data.loc[:idx, "Volume"].sum()
-                formatted_total_volume = self.chart_view.format_volume(total_volume)
-                
-                self.series.append(QCandlestickSet(o, h, l, c, ts))
-                
-                if pd.notna(ma20):
-                    self.ma20_series.append(ts, ma20)
-                if pd.notna(ma50):
-                    self.ma50_series.append(ts, ma50)
-                if pd.notna(ma200):
-                    self.ma200_series.append(ts, ma200)
-                
-                self.chart_view.candles.append({
-                    "timestamp": ts, "open": o, "high": h, "low": l, "close": c,
-                    "volume": v, "rsi": rsi, "rsi_region": rsi_region,
-                    "formatted_volume": formatted_volume,
-                    "total_volume": total_volume,
-                    "formatted_total_volume": formatted_total_volume,
-                    "cumulative_money_flow": cumulative_money_flow,
-                    "ma20": ma20, "ma50": ma50, "ma200": ma200
-                })
-                min_p = min(min_p, l)
-                max_p = max(max_p, h)
-
-            if not data.empty:
-                try:
-                    if self.historical_radio.isChecked():
-                        min_time = QDateTime(data.index[0].to_pydatetime().date(), QTime(0, 0))
-                        max_time = QDateTime(data.index[0].to_pydatetime().date(), QTime(23, 59))
-                        self.axisX.setRange(min_time, max_time)
-                    else:
-                        self.axisX.setRange(
-                            QDateTime(data.index[0].to_pydatetime()),
-                            QDateTime(data.index[-1].to_pydatetime())
-                        )
-                    self.axisY.setRange(min_p * 0.98, max_p * 1.02)
-                except Exception as e:
-                    print(f"Eksen ayarlama hatası: {e}")
-
-            # Pivot hesaplamaları
-            if self.live_radio.isChecked():
-                pivot_data = data[data.index.date == now.date()]
-            else:
-                selected_date = pd.to_datetime(self.date_combo.currentText()).date()
-                pivot_data = data[data.index.date == selected_date]
-
-            if pivot_data.empty:
-                pivot_data = data
-
-            high = pivot_data["High"].max()
-            low = pivot_data["Low"].min()
-            close = pivot_data["Close"].iloc[-1] if not pivot_data.empty else 0
-            pivot = (high + low + close) / 3
-            s1 = (2 * pivot) - high
-            s2 = pivot - (high - low)
-            r1 = (2 * pivot) - low
-            r2 = pivot + (high - low)
-
-            self.pivot_label.setText(f"Pivot: {pivot:.2f}")
-            self.support1_label.setText(f"Destek 1: {s1:.2f}")
-            self.support2_label.setText(f"Destek 2: {s2:.2f}")
-            self.resistance1_label.setText(f"Direnç 1: {r1:.2f}")
-            self.resistance2_label.setText(f"Direnç 2: {r2:.2f}")
+                    # Sayısal sıralama için değer metin değil sayı olarak saklanır
+                    item.setData(Qt.DisplayRole, round(float(values[key]), 2))
+                    if key == "change":
+                        item.setForeground(QColor(GREEN_COLOR if values[key] >= 0 else RED_COLOR))
+                self.table.setItem(row, column, item)
+        self.table.setSortingEnabled(True)
+
+    def _on_row_activated(self, row, column):
+        self.open_symbol.emit(self.table.item(row, 0).text())
+
+    def shutdown(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        # Tarayıcı kapanınca süreç havuzu da kapanır; yeniden açılırsa ilk taramada kurulur
+        screener.shutdown()
+
+
+class PerfHud(QLabel):
+    # F12 ile açılan performans göstergesi; açıkken izleyiciyi de açar
+    STAGES = ("hover", "crosshair_paint", "wheel", "series", "render", "quote", "prepare_candles",
+              "indicators", "filter_market_hours", "history", "download")
+
+    def __init__(self, parent, current_tab):
+        super().__init__(parent)
+        self._current_tab = current_tab
+        self._was_enabled = tracer.enabled
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setTextFormat(Qt.PlainText)
+        self.setStyleSheet(f"""
+            background-color: rgba(15, 15, 20, 210);
+            color: {TEXT_COLOR};
+            font-family: monospace;
+            font-size: 11px;
+            padding: 6px;
+            border-radius: 4px;
+        """)
+        self.timer = QTimer(self)
+        self.timer.setInterval(HUD_REFRESH_MS)
+        self.timer.timeout.connect(self.update_text)
+        self.hide()
+
+    def toggle(self):
+        if self.isVisible():
+            self.timer.stop()
+            self.hide()
+            tracer.enabled = self._was_enabled
+            return
+        self._was_enabled = tracer.enabled
+        tracer.enabled = True
+        self.update_text()
+        self.show()
+        self.raise_()
+        self.timer.start()
+
+    def update_text(self):
+        stats = tracer.stats()
+        tab = self._current_tab()
+        names = [f"refresh:{tab.symbol}"] if isinstance(tab, StockChartTab) else []
+        lines = [f"{'aşama':<22}{'n':>5}{'p50':>8}{'p95':>8}{'max':>8}"]
+        for name in names + list(self.STAGES):
+            if name in stats:
+                count, p50, p95, peak = stats[name]
+                lines.append(f"{name:<22}{count:>5}{p50:>8.2f}{p95:>8.2f}{peak:>8.2f}")
+        self.setText("\n".join(lines) + "\n(ms)")
+        self.adjustSize()
+        parent = self.parentWidget()
+        self.move(parent.width() - self.width() - 12, 12)
 
-        except Exception as e:
-            QMessageBox.critical(self, "Hata", f"Grafik güncellenirken hata oluştu: {str(e)}")
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -704,6 +2643,7 @@ class MainWindow(QMainWindow):
         self.tabs.setDocumentMode(True)
         self.tabs.setTabsClosable(True)
         self.tabs.tabCloseRequested.connect(self.close_tab)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         # Arama paneli
         search_frame = QFrame()
@@ -746,9 +2686,22 @@ class MainWindow(QMainWindow):
         """)
         self.search_button.clicked.connect(self.search_stock)
         self.search_box.returnPressed.connect(self.search_stock)
+
+        # Yerel sembol listesinden anlık öneriler
+        self.completer = QCompleter(self)
+        self.completer.setModel(QStringListModel(self.completer))
+        self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.completer.activated[str].connect(self._on_completion)
+        self.search_box.setCompleter(self.completer)
+        self.search_box.textEdited.connect(self._update_suggestions)
         
+        self.screener_button = QPushButton("Tarayıcı")
+        self.screener_button.setStyleSheet(self.search_button.styleSheet())
+        self.screener_button.clicked.connect(self.open_screener)
+
         search_layout.addWidget(self.search_box)
         search_layout.addWidget(self.search_button)
+        search_layout.addWidget(self.screener_button)
         
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(10, 10, 10, 10)
@@ -760,43 +2713,70 @@ class MainWindow(QMainWindow):
         container.setLayout(main_layout)
         self.setCentralWidget(container)
 
+        self._name_tasks = {}
+
+        self.hud = PerfHud(self, self.tabs.currentWidget)
+        QShortcut(QKeySequence("F12"), self, self.hud.toggle)
+
+        # Tüm sekmeler için tek, toplu canlı veri yenilemesi
+        self.scheduler = RefreshScheduler(self.open_tabs, self)
+        self.scheduler.start()
+
+    def open_tabs(self):
+        return [
+            self.tabs.widget(i) for i in range(self.tabs.count())
+            if isinstance(self.tabs.widget(i), StockChartTab)
+        ]
+
+    def open_screener(self):
+        for i in range(self.tabs.count()):
+            if isinstance(self.tabs.widget(i), ScreenerTab):
+                self.tabs.setCurrentIndex(i)
+                return
+        screener_tab = ScreenerTab()
+        screener_tab.open_symbol.connect(self.open_symbol)
+        self.tabs.setCurrentIndex(self.tabs.addTab(screener_tab, "Tarayıcı"))
+
+    def open_symbol(self, symbol):
+        self.search_box.setText(symbol)
+        self.search_stock()
+
+    def _update_suggestions(self, text):
+        self.completer.model().setStringList(
+            [f"{symbol} - {symbol_index.name(symbol)}" for symbol in symbol_index.search(text)]
+        )
+
+    def _on_completion(self, text):
+        self.search_box.setText(text.split(" - ")[0])
+        self.search_stock()
+
     def search_stock(self):
-        symbol = self.search_box.text().upper().strip()
+        symbol = self.search_box.text().split(" - ")[0].upper().strip()
         if not symbol:
             return
             
         if symbol not in [self.tabs.tabText(i) for i in range(self.tabs.count())]:
-            try:
-                # Hisse adını almak için bir sorgu yapalım
-                full_symbol = symbol + ".IS"
-                stock = yf.Ticker(full_symbol)
-                info = stock.info
-                name = info.get('shortName', symbol)
-                
-                new_tab = StockChartTab(name, symbol)
-                tab_index = self.tabs.addTab(new_tab, symbol)
-                self.tabs.setCurrentIndex(tab_index)
-                self.search_box.clear()
-                
-                # Başarılı ekleme sonrası geçici mesaj
-                msg = QMessageBox()
-                msg.setIcon(QMessageBox.Information)
-                msg.setText(f"{name} ({symbol}) hissesi eklendi")
-                msg.setWindowTitle("Başarılı")
-                msg.setStandardButtons(QMessageBox.Ok)
-                msg.setStyleSheet(f"""
-                    QMessageBox {{
-                        background-color: {DARK_BACKGROUND};
-                        color: {TEXT_COLOR};
-                    }}
-                    QLabel {{
-                        color: {TEXT_COLOR};
-                    }}
-                """)
-                msg.exec_()
-                
-            except Exception as e:
-                QMessageBox.warning(self, "Hata", f"{symbol} hissesi eklenirken hata oluştu: {str(e)}")
+            if symbol not in symbol_index:
+                # Yerel listede olmayan kod ağa çıkmadan reddedilir; liste eksikse kullanıcı yine de deneyebilir
+                answer = QMessageBox.question(
+                    self, "Bilinmeyen Sembol",
+                    f"{symbol} yerel BIST sembol listesinde bulunamadı. Yine de çevrimiçi denensin mi?",
+                    QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+                )
+                if answer != QMessageBox.Yes:
+                    return
+
+            # Sekme hemen eklenir; hisse adı arka planda (ya da diskteki kayıttan) gelir
+            new_tab = StockChartTab(symbol_names.get(symbol) or symbol, symbol)
+            tab_index = self.tabs.addTab(new_tab, symbol)
+            self.tabs.setCurrentIndex(tab_index)
+            self.search_box.clear()
+
+            task = FetchTask(next(_request_ids), load_symbol_name, symbol)
+            task.signals.finished.connect(self._on_name_loaded)
+            task.signals.failed.connect(self._on_name_failed)
+            self._name_tasks[task.request_id] = task
+            QThreadPool.globalInstance().start(task)
         else:
             # Eğer sekme zaten varsa, o sekmeye geç
             for i in range(self.tabs.count()):
@@ -804,14 +2784,78 @@ class MainWindow(QMainWindow):
                     self.tabs.setCurrentIndex(i)
                     break
 
+    def _tab_for(self, symbol):
+        # Sekme bu arada kapatılmış olabilir; nesneyi tutmak yerine sembolle aranır
+        return next((tab for tab in self.open_tabs() if tab.symbol == symbol), None)
+
+    def _on_name_loaded(self, request_id, name):
+        symbol = self._name_tasks.pop(request_id).args[0]
+        if name != symbol:
+            symbol_index.add(symbol, name)
+        tab = self._tab_for(symbol)
+        if tab is None:
+            return
+        tab.set_name(name)
+
+        # Başarılı ekleme sonrası geçici mesaj
+        msg = QMessageBox()
+        msg.setIcon(QMessageBox.Information)
+        msg.setText(f"{name} ({tab.symbol}) hissesi eklendi")
+        msg.setWindowTitle("Başarılı")
+        msg.setStandardButtons(QMessageBox.Ok)
+        msg.setStyleSheet(f"""
+            QMessageBox {{
+                background-color: {DARK_BACKGROUND};
+                color: {TEXT_COLOR};
+            }}
+            QLabel {{
+                color: {TEXT_COLOR};
+            }}
+        """)
+        msg.exec_()
+
+    def _on_name_failed(self, request_id, error):
+        symbol = self._name_tasks.pop(request_id).args[0]
+        if self._tab_for(symbol) is not None:
+            QMessageBox.warning(self, "Hata", f"{symbol} hissesi eklenirken hata oluştu: {str(error)}")
+
+    def _on_tab_changed(self, index):
+        tab = self.tabs.widget(index)
+        if isinstance(tab, StockChartTab):
+            tab.catch_up()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized():
+            self._on_tab_changed(self.tabs.currentIndex())
+
     def close_tab(self, index):
         if self.tabs.count() > 1:
+            widget = self.tabs.widget(index)
+            widget.shutdown()
             self.tabs.removeTab(index)
+            widget.deleteLater()
         else:
             QMessageBox.information(self, "Bilgi", "En az bir sekme açık olmalıdır.")
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    import argparse
+    parser = argparse.ArgumentParser(description="BIST Hisse Grafik Analiz Aracı")
+    parser.add_argument("--provider", choices=("yahoo", "replay"), default="yahoo",
+                        help="veri kaynağı; replay kaydedilmiş barları ağsız oynatır")
+    parser.add_argument("--replay", help="oynatılacak kayıt: <SEMBOL>_<aralık>.csv|.parquet dizini ya da tek dosya")
+    parser.add_argument("--speed", type=float, default=1.0, help="oynatma hızı (1-1000)")
+    parser.add_argument("--open", nargs="*", default=[], help="açılışta sekmesi açılacak semboller")
+    parser.add_argument("--trace", help="aşama sürelerini kaydet ve çıkışta Chrome izleme JSON'u olarak yaz")
+    args, qt_args = parser.parse_known_args()
+    tracer.enabled = bool(args.trace)
+    if args.provider == "replay":
+        if not args.replay:
+            parser.error("--provider replay için --replay gerekli")
+        set_data_provider(ReplayProvider.from_path(args.replay, min(max(args.speed, 1.0), 1000.0)))
+
+    app = QApplication(sys.argv[:1] + qt_args)
+    app.aboutToQuit.connect(screener.shutdown)
     
     # Genel uygulama stili
     app.setStyle("Fusion")
@@ -834,4 +2878,9 @@ if __name__ == "__main__":
     
     window = MainWindow()
     window.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    for symbol in args.open:
+        window.open_symbol(symbol)
+    status = app.exec_()
+    if args.trace:
+        tracer.export(args.trace)
+    sys.exit(status)
\ No newline at end of file
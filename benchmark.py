@@ -0,0 +1,266 @@
+"""Grafik uygulamasının sıcak yolları için başsız (offscreen) performans ölçümü.
+
+Ağa çıkmaz: sentetik ya da kaydedilmiş (CSV) OHLCV verisiyle gösterge hesabı,
+piyasa saati filtresi, mum hazırlama, seri doldurma ve fare üzerindeki mumu bulma
+adımlarını 1k/10k/100k bar için ölçer; p50/p95 gecikme ve en yüksek bellek kullanımını
+raporlar. Kaydedilmiş bir taban çizgisine göre belirgin yavaşlama varsa 1, taban çizgisi
+yoksa ya da ölçülen durumların hiçbirini içermiyorsa 2 ile çıkar. Taban çizgisi makineye
+özeldir ve depoya eklenmez (.gitignore).
+
+    python benchmark.py                      # ölç ve taban çizgisiyle karşılaştır
+    python benchmark.py --save-baseline      # bu makinedeki sonuçları taban çizgisi yap
+    python benchmark.py --fixture bars.csv   # kaydedilmiş veriyle ölç
+"""
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+import tracemalloc
+import importlib.util
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(HERE, "BUGUN CALISTIGIMIZ.py")
+BASELINE_PATH = os.path.join(HERE, "benchmark_baseline.json")
+DEFAULT_SIZES = (1000, 10000, 100000)
+# Her durum en az MIN_RUNS kez, toplam süre bütçesi dolana kadar en çok MAX_RUNS kez çalışır
+MIN_RUNS = 3
+MAX_RUNS = 30
+CASE_BUDGET_SECONDS = 2.0
+HOVER_EVENTS = 200
+
+
+def load_app():
+    spec = importlib.util.spec_from_file_location("bugun_calistigimiz", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_bars(n, seed=0):
+    # Piyasa saatleri içinde dakikalık rastgele yürüyüş
+    rng = np.random.default_rng(seed)
+    days = pd.bdate_range("2024-01-02", periods=n // 480 + 2, tz="Europe/Istanbul")
+    minutes = pd.timedelta_range("10:00:00", periods=480, freq="min")
+    index = pd.DatetimeIndex((days.values[:, None] + minutes.values[None, :]).ravel()[:n]).tz_localize(
+        "UTC").tz_convert("Europe/Istanbul")
+    close = 100 + np.cumsum(rng.normal(0, 0.1, n))
+    spread = np.abs(rng.normal(0, 0.05, (2, n)))
+    open_ = close + rng.normal(0, 0.03, n)
+    return pd.DataFrame({
+        "Open": open_,
+        "High": np.maximum(open_, close) + spread[0],
+        "Low": np.minimum(open_, close) - spread[1],
+        "Close": close,
+        "Volume": rng.integers(100, 10000, n).astype(float),
+    }, index=index)
+
+
+def fixture_bars(path, n):
+    # Kaydedilmiş barlar n'e ulaşana kadar zaman ekseninde kaydırılarak çoğaltılır
+    frame = pd.read_csv(path, index_col=0)
+    frame.index = pd.to_datetime(frame.index, utc=True).tz_convert("Europe/Istanbul")
+    frame = frame[["Open", "High", "Low", "Close", "Volume"]].dropna()
+    span = frame.index[-1] - frame.index[0] + pd.Timedelta(days=1)
+    parts = [frame.set_axis(frame.index + span * i) for i in range(-(-n // len(frame)))]
+    return pd.concat(parts).iloc[:n]
+
+
+def measure(func, setup=None):
+    # İlk çalıştırma (önbellekler, tembel içe aktarmalar) ölçüme katılmaz
+    func(setup() if setup else None)
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < MIN_RUNS or (len(samples) < MAX_RUNS and time.perf_counter() - started < CASE_BUDGET_SECONDS):
+        state = setup() if setup else None
+        t0 = time.perf_counter()
+        func(state)
+        samples.append(time.perf_counter() - t0)
+
+    # Bellek ayrı bir çalıştırmada ölçülür; tracemalloc zamanlamayı bozmasın
+    state = setup() if setup else None
+    gc.collect()
+    tracemalloc.start()
+    func(state)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return samples, peak
+
+
+class Bench:
+    def __init__(self, app, qt_app):
+        self.app = app
+        self.qt_app = qt_app
+
+    def cases(self, data):
+        app = self.app
+        candles = app.prepare_candles(data.assign(
+            RSI=app.calculate_rsi(data),
+            MA20=data["Close"].rolling(20).mean(),
+            MA50=data["Close"].rolling(50).mean(),
+            MA200=data["Close"].rolling(200).mean(),
+        ), True)
+
+        def indicators(_):
+            app.calculate_rsi(data)
+            for window in (20, 50, 200):
+                data["Close"].rolling(window).mean()
+
+        def indicator_stream(_):
+            app.IndicatorEngine(warmup=len(data)).sync(data)
+
+        yield "indicators", measure(indicators)
+        yield "indicator_stream", measure(indicator_stream)
+        yield "filter_market_hours", measure(lambda frame: app.filter_market_hours(frame),
+                                             lambda: data.copy(deep=False))
+        yield "prepare_candles", measure(lambda _: app.prepare_candles(data, True))
+        yield "series_full", measure(self.populate, lambda: (candles, 1))
+        yield "series_lod", measure(self.populate, lambda: (candles, max(1, len(candles) // 1000)))
+        yield "hover", self.hover(candles)
+
+    def populate(self, state):
+        # Sekmenin tam yeniden çizim yolu: (gerekirse) özetle, toplu ekle
+        from PyQt5.QtChart import QCandlestickSeries, QLineSeries
+        candles, size = state
+        app = self.app
+        shown = candles if size == 1 else app.aggregate_candles(candles, 0, len(candles), size)
+        series = QCandlestickSeries()
+        series.append(app.StockChartTab._candle_sets(shown))
+        for name in ("ma20", "ma50", "ma200"):
+            values = getattr(candles, name)
+            idx = app.minmax_decimate(values, 0, len(candles), size)
+            QLineSeries().replace(app.StockChartTab._line_points(candles.timestamp[idx], values[idx]))
+
+    def hover(self, candles):
+        # Görünür alan üzerinde yatay fare hareketi; her olay ayrı bir örnek
+        from PyQt5.QtWidgets import QLabel
+        from PyQt5.QtChart import QChart, QCandlestickSeries, QDateTimeAxis, QValueAxis
+        from PyQt5.QtCore import Qt, QPoint, QDateTime, QEvent
+        from PyQt5.QtGui import QMouseEvent
+        app = self.app
+
+        shown = app.aggregate_candles(candles, 0, len(candles), max(1, len(candles) // 1000))
+        chart = QChart()
+        series = QCandlestickSeries()
+        series.append(app.StockChartTab._candle_sets(shown))
+        chart.addSeries(series)
+        axis_x, axis_y = QDateTimeAxis(), QValueAxis()
+        chart.addAxis(axis_x, Qt.AlignBottom)
+        chart.addAxis(axis_y, Qt.AlignLeft)
+        series.attachAxis(axis_x)
+        series.attachAxis(axis_y)
+        axis_x.setRange(QDateTime.fromMSecsSinceEpoch(int(candles.timestamp[0])),
+                        QDateTime.fromMSecsSinceEpoch(int(candles.timestamp[-1])))
+        axis_y.setRange(float(np.nanmin(candles.low)), float(np.nanmax(candles.high)))
+
+        labels = [QLabel() for _ in range(17)]
+        view = app.InteractiveChartView(chart, series, *labels)
+        view.candles = candles
+        view.resize(1200, 700)
+        view.show()
+        self.qt_app.processEvents()
+
+        def sweep(_):
+            for x in np.linspace(60, 1140, HOVER_EVENTS).astype(int):
+                event = QMouseEvent(QEvent.MouseMove, QPoint(int(x), 350), Qt.NoButton, Qt.NoButton, Qt.NoModifier)
+                t0 = time.perf_counter()
+                view.mouseMoveEvent(event)
+                samples.append(time.perf_counter() - t0)
+
+        samples = []
+        sweep(None)
+        gc.collect()
+        tracemalloc.start()
+        sweep(None)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        view.close()
+        return samples[:HOVER_EVENTS], peak
+
+
+def calibrate(runs=5):
+    # Sabit bir Python + NumPy iş yükü; makine o an yavaşsa karşılaştırma buna göre ölçeklenir
+    values = np.random.default_rng(0).random(200000)
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        sum(i * i for i in range(100000))
+        np.sort(values)
+        samples.append(time.perf_counter() - t0)
+    return float(np.median(samples) * 1000)
+
+
+def summarize(samples, peak, calibration_ms):
+    ms = np.asarray(samples) * 1000
+    return {"p50_ms": float(np.percentile(ms, 50)), "p95_ms": float(np.percentile(ms, 95)),
+            "peak_kb": peak / 1024, "runs": len(ms), "calibration_ms": calibration_ms}
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        # Süreler ölçüm anındaki kalibrasyona oranlanır; paylaşımlı makinelerdeki hız dalgalanması elenir.
+        # Milisaniyenin altındaki ölçümlerde göreli gürültü yüksek; mutlak bir pay da tanınır.
+        expected = base["p50_ms"] * result["calibration_ms"] / base["calibration_ms"]
+        if result["p50_ms"] > expected * (1 + tolerance) + 0.05:
+            regressions.append(f"{key}: p50 {expected:.3f} -> {result['p50_ms']:.3f} ms")
+        if result["peak_kb"] > base["peak_kb"] * (1 + tolerance) + 64:
+            regressions.append(f"{key}: bellek {base['peak_kb']:.0f} -> {result['peak_kb']:.0f} KB")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--fixture", help="Datetime indeksli OHLCV CSV dosyası")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="izin verilen göreli yavaşlama")
+    args = parser.parse_args(argv)
+
+    from PyQt5.QtWidgets import QApplication
+    qt_app = QApplication.instance() or QApplication([])
+    bench = Bench(load_app(), qt_app)
+
+    results = {}
+    print(f"{'durum':<22}{'bar':>8}{'p50 ms':>12}{'p95 ms':>12}{'bellek KB':>12}")
+    for n in args.sizes:
+        data = fixture_bars(args.fixture, n) if args.fixture else synthetic_bars(n)
+        calibration_ms = calibrate()
+        for name, (samples, peak) in bench.cases(data):
+            result = results[f"{name}/{n}"] = summarize(samples, peak, calibration_ms)
+            calibration_ms = calibrate()
+            print(f"{name:<22}{n:>8}{result['p50_ms']:>12.3f}{result['p95_ms']:>12.3f}{result['peak_kb']:>12.0f}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+        print(f"Taban çizgisi kaydedildi: {args.baseline}")
+        return 0
+
+    # Karşılaştırılamayan bir çalıştırma başarılı sayılmaz
+    if not os.path.exists(args.baseline):
+        print(f"Taban çizgisi yok: {args.baseline} (önce --save-baseline ile oluşturun)")
+        return 2
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if not results.keys() & baseline.keys():
+        print("Taban çizgisi ölçülen durumların hiçbirini içermiyor (--sizes farklı mı?)")
+        return 2
+    regressions = compare(results, baseline, args.tolerance)
+    for line in regressions:
+        print(f"GERİLEME {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
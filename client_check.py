@@ -0,0 +1,167 @@
+"""MarketDataClient için yerel HTTP taslak sunucusuna karşı denetim.
+
+Ağa çıkmaz: 127.0.0.1 üzerinde geçici bir sunucu başlatır ve istemciyi, isteği o sunucuya
+yapan bir getirme fonksiyonuyla çalıştırır. Yeniden deneme, kalıcı hataların denenmemesi,
+zaman aşımı sonrası yeniden denemelerin gerçekten çalışması ve eşzamanlılık sınırı sınanır;
+bir beklenti tutmazsa 1 ile çıkar.
+
+    python client_check.py
+    python client_check.py --base-url http://127.0.0.1:8000   # başka bir taslak sunucu
+"""
+import sys
+import json
+import time
+import argparse
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import wait
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from benchmark import load_app
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # /ok, /slow?delay=s, /flaky?key=k&fail=n (ilk n istek 503), /bad (400)
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        server = self.server
+        with server.lock:
+            server.hits[url.path] = server.hits.get(url.path, 0) + 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            key = query.get("key", "")
+            server.keys[key] = server.keys.get(key, 0) + 1
+            seen = server.keys[key]
+        try:
+            if url.path == "/slow":
+                time.sleep(float(query.get("delay", 1)))
+            if url.path == "/bad":
+                self._reply(400, {"error": "bad request"})
+            elif url.path == "/flaky" and seen <= int(query.get("fail", 1)):
+                self._reply(503, {"error": "unavailable"})
+            else:
+                self._reply(200, {"path": url.path, "seen": seen})
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.hits, server.keys = {}, {}
+    server.in_flight = server.max_in_flight = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def http_get(url, timeout=None):
+    # İstemciye verilen getirme fonksiyonu; 4xx kalıcı hata (denenmez), diğerleri geçicidir
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return json.load(response)
+    except urllib.error.HTTPError as e:
+        if 400 <= e.code < 500:
+            raise ValueError(f"HTTP {e.code}") from e
+        raise
+
+
+class Checks:
+    def __init__(self, app, base_url, server=None):
+        self.app = app
+        self.base_url = base_url.rstrip("/")
+        self.server = server
+        self.failures = []
+
+    def expect(self, condition, message):
+        print(f"{'tamam' if condition else 'HATA '} {message}")
+        if not condition:
+            self.failures.append(message)
+
+    def client(self, **kwargs):
+        return self.app.MarketDataClient(**dict(dict(backoff=0.01), **kwargs))
+
+    def hits(self, path):
+        return self.server.hits.get(path, 0) if self.server else None
+
+    def retry(self):
+        client = self.client(retries=3)
+        result = client.call(http_get, f"{self.base_url}/flaky?key=retry&fail=2", timeout=5)
+        self.expect(result.get("seen") == 3, "geçici 503 hataları yeniden denenip başarıya ulaşıyor")
+        client.close()
+
+    def non_retryable(self):
+        client = self.client(retries=3)
+        before = self.hits("/bad")
+        try:
+            client.call(http_get, f"{self.base_url}/bad", timeout=5)
+            raised = False
+        except ValueError:
+            raised = True
+        self.expect(raised, "kalıcı hata (400) çağırana ValueError olarak ulaşıyor")
+        if self.server:
+            self.expect(self.hits("/bad") - before == 1, "kalıcı hata yeniden denenmiyor")
+        client.close()
+
+    def timeout_retries(self, http_timeout):
+        # Çağrılar bekleme süresinden uzun sürer; her deneme sunucuya gerçekten ulaşmalı
+        # ve aynı anda sunucuda max_concurrency'den fazla istek olmamalı
+        calls, retries, concurrency = 4, 1, 2
+        client = self.client(max_concurrency=concurrency, timeout=0.3, retries=retries)
+        before = self.hits("/slow")
+        if self.server:
+            self.server.max_in_flight = 0
+        futures = [client.submit(http_get, f"{self.base_url}/slow?delay=1", timeout=http_timeout)
+                   for _ in range(calls)]
+        wait(futures, timeout=30)
+        timed_out = sum(1 for f in futures if f.done() and f.exception() is not None)
+        label = "HTTP zaman aşımıyla" if http_timeout else "yalnızca bekleme zaman aşımıyla"
+        self.expect(timed_out == calls, f"{label}: tüm çağrılar zaman aşımıyla bitiyor")
+        if self.server:
+            executed = self.hits("/slow") - before
+            self.expect(executed == calls * (retries + 1),
+                        f"{label}: {calls * (retries + 1)} denemenin hepsi çalıştı ({executed})")
+            if not http_timeout:
+                self.expect(self.server.max_in_flight <= concurrency,
+                            f"{label}: eşzamanlı istek {self.server.max_in_flight} <= {concurrency}")
+        # Zaman aşımına uğrayan son çağrılar bitmeden döngü durdurulmasın
+        time.sleep(1.5)
+        client.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", help="hazır bir taslak sunucu; verilmezse yerelde başlatılır")
+    args = parser.parse_args(argv)
+
+    server = None if args.base_url else start_stub()
+    base_url = args.base_url or f"http://127.0.0.1:{server.server_address[1]}"
+    checks = Checks(load_app(), base_url, server)
+    checks.retry()
+    checks.non_retryable()
+    checks.timeout_retries(http_timeout=None)
+    checks.timeout_retries(http_timeout=0.3)
+    if server:
+        server.shutdown()
+    return 1 if checks.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
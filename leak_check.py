@@ -0,0 +1,146 @@
+"""Sekme açma/kapama için başsız (offscreen) bellek sızıntısı denetimi.
+
+Ağa çıkmaz: sentetik dakikalık barları oynatan bir ReplayProvider ile ana pencerede
+100 grafik sekmesi açıp kapatır. Sekmelerin yarısı verisi çizildikten sonra, yarısı
+yüklemeleri havuzda beklerken kapatılır. Isınma turlarından sonra süreç belleği (RSS),
+canlı widget ya da Python nesnesi sayısı eşiği aşarsa veya kapatılan sekmelerden
+StockChartTab/InteractiveChartView örneği kalırsa 1 ile çıkar.
+
+    python leak_check.py                 # 100 sekme, varsayılan eşikler
+    python leak_check.py --tabs 300      # daha uzun tur
+"""
+import os
+import sys
+import gc
+import time
+import argparse
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from benchmark import load_app, synthetic_bars
+
+SYMBOL = "THYAO"
+DAYS = 30
+WARMUP_TABS = 20
+
+
+def rss_mb():
+    # Linux'ta /proc, diğer sistemlerde en yüksek RSS (yalnızca artabilir; yine de üst sınır işi görür)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except OSError:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+class LeakCheck:
+    def __init__(self, app, qt_app):
+        from PyQt5.QtCore import QThreadPool
+        self.app = app
+        self.qt_app = qt_app
+        # Tek iş parçacığı: kapatılan sekmenin yüklemeleri kesin olarak kuyrukta bekler
+        self.pool = QThreadPool.globalInstance()
+        self.pool.setMaxThreadCount(1)
+        bars = synthetic_bars(DAYS * 480)
+        app.set_data_provider(app.ReplayProvider({SYMBOL: {"1m": bars}}, start=bars.index[-1]))
+        self.window = app.MainWindow()
+        self.window.scheduler.timer.stop()
+        self.window.scheduler.stream_timer.stop()
+        # Son sekme kapatılamadığından ölçüm boyunca açık kalan bir sekme
+        self.window.tabs.addTab(app.StockChartTab(SYMBOL, SYMBOL), SYMBOL)
+        self.window.show()
+        self.settle(0.2)
+
+    def settle(self, seconds=0.0):
+        from PyQt5.QtCore import QCoreApplication, QEvent
+        end = time.monotonic() + seconds
+        while True:
+            self.qt_app.processEvents()
+            if time.monotonic() >= end and self.pool.activeThreadCount() == 0:
+                break
+            time.sleep(0.005)
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+        self.qt_app.processEvents()
+        gc.collect()
+
+    def cycle(self, count):
+        tabs = self.window.tabs
+        for i in range(count):
+            if i % 2:
+                self.pool.start(self.app.FetchTask(0, time.sleep, 0.02))
+            tab = self.app.StockChartTab(SYMBOL, SYMBOL)
+            tabs.addTab(tab, SYMBOL)
+            tabs.setCurrentWidget(tab)
+            if i % 2:
+                # Yüklemeler havuzda beklerken kapatma; iptal edilen görevler kuyrukta kalır
+                self.window.close_tab(tabs.indexOf(tab))
+            else:
+                self.settle(0.05)
+                self.window.close_tab(tabs.indexOf(tab))
+            self.settle()
+
+    def rendered(self):
+        tab = self.window.tabs.widget(0)
+        return len(tab.chart_view.candles)
+
+    def snapshot(self):
+        return rss_mb(), len(self.qt_app.allWidgets()), len(gc.get_objects())
+
+    def survivors(self):
+        # Pencerede açık olanlar dışında yaşayan sekme/grafik örnekleri
+        kinds = (self.app.StockChartTab, self.app.InteractiveChartView)
+        counts = {kind.__name__: 0 for kind in kinds}
+        for obj in gc.get_objects():
+            for kind in kinds:
+                if isinstance(obj, kind):
+                    counts[kind.__name__] += 1
+        open_tabs = len(self.window.open_tabs())
+        return {name: count - open_tabs for name, count in counts.items() if count > open_tabs}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tabs", type=int, default=100)
+    parser.add_argument("--max-rss-mb", type=float, default=20.0, help="izin verilen RSS artışı")
+    parser.add_argument("--max-widgets", type=int, default=0, help="izin verilen canlı widget artışı")
+    parser.add_argument("--max-objects", type=int, default=2000,
+                        help="izin verilen Python nesnesi artışı (önbellek girdileri için pay)")
+    args = parser.parse_args(argv)
+
+    from PyQt5.QtWidgets import QApplication
+    qt_app = QApplication.instance() or QApplication([])
+    check = LeakCheck(load_app(), qt_app)
+    if not check.rendered():
+        print("Sekme veri çizmedi; oynatma verisi yüklenemedi")
+        return 1
+
+    # Açılıştaki tek seferlik önbellekler ve tembel içe aktarmalar ölçüme katılmaz
+    check.cycle(WARMUP_TABS)
+    rss0, widgets0, objects0 = check.snapshot()
+    started = time.perf_counter()
+    check.cycle(args.tabs)
+    rss1, widgets1, objects1 = check.snapshot()
+
+    print(f"{args.tabs} sekme, {time.perf_counter() - started:.1f} s")
+    print(f"RSS      {rss0:8.1f} -> {rss1:8.1f} MB")
+    print(f"widget   {widgets0:8d} -> {widgets1:8d}")
+    print(f"nesne    {objects0:8d} -> {objects1:8d}")
+
+    failures = []
+    if rss1 - rss0 > args.max_rss_mb:
+        failures.append(f"RSS {rss1 - rss0:.1f} MB arttı (sınır {args.max_rss_mb:.1f})")
+    if widgets1 - widgets0 > args.max_widgets:
+        failures.append(f"canlı widget sayısı {widgets1 - widgets0} arttı (sınır {args.max_widgets})")
+    if objects1 - objects0 > args.max_objects:
+        failures.append(f"nesne sayısı {objects1 - objects0} arttı (sınır {args.max_objects})")
+    for name, count in check.survivors().items():
+        failures.append(f"kapatılan sekmelerden {count} {name} örneği yaşıyor")
+    for line in failures:
+        print(f"SIZINTI {line}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())